@@ -0,0 +1,61 @@
+"""
+Nightly report job: per-user loop vs FileHandler.export_monthly_reports_batch.
+
+The loop is the old job: load each profile once per month and filter its
+transactions for that month before exporting.
+
+Run from the repository root:
+    python benchmarks/bench_batch_reports.py [users] [workers]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'classes'))
+from file_handler import FileHandler
+
+CATEGORIES = ["Food", "Housing", "Transport", "Utilities", "Entertainment"]
+MONTHS = [(2024, m) for m in range(1, 13)]
+
+
+def write_profiles(handler, users):
+    for u in range(users):
+        transactions = [{"date": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}", "description": f"Purchase {i}",
+                         "amount": i % 90 + 0.5, "category": CATEGORIES[i % 5]} for i in range(60)]
+        handler.save_user_profile(f"user{u:06d}", 4000, "Ohio", transactions)
+
+
+def per_user_loop(handler, usernames, tax_rate):
+    for username in usernames:
+        for year, month in MONTHS:
+            profile = handler.load_user_profile(username)
+            prefix = f"{year}-{month:02d}"
+            rows = [t for t in profile['transactions'] if t['date'].startswith(prefix)]
+            handler.export_monthly_report(username, month, year, rows, profile['income'] * (1 - tax_rate))
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = FileHandler(tmp)
+        write_profiles(handler, users)
+        usernames = handler.list_users()
+        print(f"{users:,} users x {len(MONTHS)} months")
+
+        start = time.perf_counter()
+        per_user_loop(handler, usernames, 0.2)
+        elapsed = time.perf_counter() - start
+        print(f"  {'per-user loop':<24} {elapsed:>7.2f} s  {users / elapsed:>10,.0f} users/s")
+
+        for n in sorted({1, workers}):
+            result = handler.export_monthly_reports_batch(usernames, MONTHS[0], MONTHS[-1], tax_rate=0.2, workers=n)
+            slowest = max(u['elapsed'] for u in result['users'])
+            print(f"  {f'batch, {n} worker(s)':<24} {result['elapsed']:>7.2f} s  "
+                  f"{users / result['elapsed']:>10,.0f} users/s  (slowest user {slowest * 1000:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
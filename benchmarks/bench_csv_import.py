@@ -0,0 +1,78 @@
+"""
+CSV import throughput: legacy csv.DictReader loop vs FileHandler's sniffed converter.
+
+Run from the repository root:
+    python benchmarks/bench_csv_import.py [rows]
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'classes'))
+from file_handler import FileHandler
+
+CATEGORIES = ["Food", "Housing", "Transport", "Utilities", "Entertainment"]
+
+
+def write_iso_csv(path, rows):
+    with open(path, 'w', newline='') as f:
+        f.write("date,description,amount,category\n")
+        for i in range(rows):
+            f.write(f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d},Purchase {i},{i % 500 + 1}.25,{CATEGORIES[i % 5]}\n")
+
+
+def write_bank_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        f.write("Date,Description,Amount,Category,,,,\r\n")
+        for i in range(rows):
+            f.write(f"{i % 12 + 1}/{i % 28 + 1}/24,Purchase {i}, ${i % 500 + 1}.25 ,{CATEGORIES[i % 5]} ,,,,\r\n")
+
+
+def legacy_import(csv_path):
+    """The DictReader loop import_transactions_from_csv used before format sniffing"""
+    transactions = []
+    with open(csv_path, 'r') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            try:
+                transaction = {
+                    'date': row['date'].strip(),
+                    'description': row['description'].strip(),
+                    'amount': float(row['amount']),
+                    'category': row['category'].strip()
+                }
+                if transaction['amount'] <= 0:
+                    raise ValueError("Amount must be positive")
+                transactions.append(transaction)
+            except ValueError:
+                continue
+    return transactions
+
+
+def timed(label, func, rows):
+    start = time.perf_counter()
+    count = len(func())
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<32} {elapsed:>7.2f} s  {rows / elapsed:>12,.0f} rows/s  ({count:,} imported)")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = FileHandler(tmp)
+        iso_path = os.path.join(tmp, "iso.csv")
+        bank_path = os.path.join(tmp, "bank.csv")
+        write_iso_csv(iso_path, rows)
+        write_bank_csv(bank_path, rows)
+        
+        print(f"{rows:,} rows")
+        timed("legacy DictReader (ISO file)", lambda: legacy_import(iso_path), rows)
+        timed("sniffed converter (ISO file)", lambda: handler.import_transactions_from_csv(iso_path), rows)
+        timed("sniffed converter (bank export)", lambda: handler.import_transactions_from_csv(bank_path), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Expense construction: the original strptime/__dict__ class vs the slotted
+Expense and Expense.from_records.
+
+Run from the repository root:
+    python benchmarks/bench_expense_construction.py [count]
+"""
+import sys
+import time
+import tracemalloc
+from datetime import datetime, date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'classes'))
+from Expense import Expense
+
+
+class LegacyExpense:
+    """Expense as it was before __slots__ and the cached date parser"""
+
+    def __init__(self, amount, category, description, date):
+        if amount <= 0:
+            raise ValueError("Expense amount must be positive.")
+        self.amount = amount
+        self.category = category.strip()
+        self.description = description.strip()
+        try:
+            self.date = datetime.strptime(date, "%Y-%m-%d").date()
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD.")
+
+
+def make_rows(count):
+    days = [(date(2024, 1, 1) + timedelta(days=i)).isoformat() for i in range(366)]
+    categories = ["Food", "Housing", "Transport", "Utilities", "Entertainment"]
+    return [(i % 500 + 1.25, categories[i % 5], f"Purchase {i % 1000}", days[i % 366]) for i in range(count)]
+
+
+def measure(label, build, rows):
+    start = time.perf_counter()
+    objects = build(rows)
+    elapsed = time.perf_counter() - start
+    assert len(objects) == len(rows)
+    del objects
+    
+    # Memory is sampled on a slice, tracemalloc slows construction too much to time with it on
+    sample = rows[:100_000]
+    tracemalloc.start()
+    objects = build(sample)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  {label:<28} {elapsed:>6.2f} s  {len(rows) / elapsed:>12,.0f} /s  {memory / len(sample):>6.0f} bytes/expense")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = make_rows(count)
+    print(f"{count:,} expenses")
+    measure("legacy Expense(...)", lambda rs: [LegacyExpense(*r) for r in rs], rows)
+    measure("slotted Expense(...)", lambda rs: [Expense(*r) for r in rs], rows)
+    measure("Expense.from_records(rows)", Expense.from_records, rows)
+
+
+if __name__ == '__main__':
+    main()
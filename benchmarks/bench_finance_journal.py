@@ -0,0 +1,45 @@
+"""
+Per-insert latency of FinanceTracker.add_expense, full-rewrite vs journal mode.
+
+Run from the repository root:
+    python benchmarks/bench_finance_journal.py [entries]
+"""
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+from finance_tracker import FinanceTracker
+
+
+def run(entries, journal, block):
+    """Insert `entries` expenses and return mean per-insert latency for each block"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = FinanceTracker(os.path.join(tmp, 'finance_data.json'), journal=journal)
+        latencies = []
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            for start in range(0, entries, block):
+                t0 = time.perf_counter()
+                for i in range(start, start + block):
+                    tracker.add_expense(12.5, 'Food', f'Purchase {i}', '2024-01-15')
+                latencies.append((start + block, (time.perf_counter() - t0) / block))
+        return latencies
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    
+    print("Full rewrite per insert (legacy)")
+    for size, latency in run(min(entries, 2_000), journal=False, block=500):
+        print(f"  {size:>8,} entries  {latency * 1e6:>10,.1f} us/insert")
+    
+    print("Journal mode")
+    for size, latency in run(entries, journal=True, block=entries // 10):
+        print(f"  {size:>8,} entries  {latency * 1e6:>10,.1f} us/insert")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Import time of Function_Library in a fresh interpreter, as a worker process would load it.
+
+Each run starts a new Python with stdin closed, so an import that prompts
+fails instead of hanging. Bytecode is cached in a temporary directory
+(after one warm-up run) so the numbers match a deployed install. Reports
+the median wall time of the whole interpreter and the module's own
+cumulative time from -X importtime.
+
+Run from the repository root:
+    python benchmarks/bench_function_library_import.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CLASSES_DIR = Path(__file__).parent.parent / 'src' / 'classes'
+
+
+def run(code, env, extra_args=()):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, *extra_args, "-c", code], stdin=subprocess.DEVNULL,
+                            capture_output=True, text=True, env=env)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        sys.exit(f"import failed:\n{result.stderr}")
+    return elapsed, result.stderr
+
+
+def module_import_us(stderr, module):
+    """Cumulative microseconds for `module` from -X importtime output"""
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    return 0
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with tempfile.TemporaryDirectory() as pycache:
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+        env.update(PYTHONPATH=str(CLASSES_DIR), PYTHONPYCACHEPREFIX=pycache)
+        run("import Function_Library", env)
+        baseline = statistics.median(run("pass", env)[0] for _ in range(runs))
+        walls, own = [], []
+        for _ in range(runs):
+            elapsed, stderr = run("import Function_Library", env, ("-X", "importtime"))
+            walls.append(elapsed)
+            own.append(module_import_us(stderr, "Function_Library"))
+    print(f"{runs} runs")
+    print(f"  empty interpreter          {baseline * 1000:>7.1f} ms")
+    print(f"  import Function_Library    {statistics.median(walls) * 1000:>7.1f} ms")
+    print(f"  Function_Library itself    {statistics.median(own) / 1000:>7.2f} ms  (-X importtime, cumulative)")
+
+
+if __name__ == '__main__':
+    main()
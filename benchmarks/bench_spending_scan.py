@@ -0,0 +1,62 @@
+"""
+Spending file aggregates: Transaction's line-by-line read vs the mmap chunk scanner.
+
+Run from the repository root:
+    python benchmarks/bench_spending_scan.py [lines] [workers]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'classes'))
+import Transaction as transaction_module
+from Transaction import Transaction
+from spending_scanner import scan_spending_file
+
+CATEGORIES = ["Food", "Housing", "Transport", "Utilities", "Entertainment"]
+MONTHS = ["January", "February", "March", "April", "May", "June"]
+
+
+def write_spending(path, lines):
+    with open(path, 'w') as f:
+        for i in range(lines):
+            f.write(f"{MONTHS[i % 6]},{i % 500 + 1}.25,{CATEGORIES[i % 5]},Purchase {i}\n")
+
+
+def transaction_aggregates(path):
+    """Cold read through Transaction, as a fresh process would do it"""
+    transaction_module._PARSED_FILES.clear()
+    totals = {}
+    for t in Transaction.get_all_transactions(path):
+        totals[t.month] = totals.get(t.month, 0) + t.amount
+    return Transaction.get_most_frequent_category(path), totals
+
+
+def timed(label, func, lines):
+    start = time.perf_counter()
+    category, totals = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:>7.2f} s  {lines / elapsed:>12,.0f} lines/s  (top: {category}, {len(totals)} months)")
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "monthly_spending.txt")
+        write_spending(path, lines)
+        print(f"{lines:,} lines, {os.path.getsize(path) / 2**20:,.0f} MiB")
+
+        def scanned(n):
+            scan = scan_spending_file(path, workers=n)
+            return scan.most_frequent_category(), scan.monthly_totals
+
+        timed("Transaction read", lambda: transaction_aggregates(path), lines)
+        timed("scanner, 1 worker", lambda: scanned(1), lines)
+        timed(f"scanner, {workers} workers", lambda: scanned(workers), lines)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Concurrent User.register stress run: N processes register overlapping usernames.
+
+Checks that users.txt ends up with no duplicate usernames or ids and
+reports registration throughput.
+
+Run from the repository root:
+    python benchmarks/stress_user_registration.py [processes] [names]
+"""
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src' / 'classes'))
+from User import User
+
+
+def register_all(storage, names):
+    registered = 0
+    for name in names:
+        try:
+            User.register(name, "Ohio", storage_path=storage)
+            registered += 1
+        except ValueError:
+            pass
+    return registered
+
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    total_names = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    names = [f"user{i}" for i in range(total_names)]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = os.path.join(tmp, "users.txt")
+        # Every process walks the same names from a different starting point
+        shards = [names[i * total_names // processes:] + names[:i * total_names // processes]
+                  for i in range(processes)]
+        
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            registered = sum(pool.map(register_all, [storage] * processes, shards))
+        elapsed = time.perf_counter() - start
+        
+        with open(storage, encoding="utf-8") as f:
+            rows = [line.rstrip("\n").split(",") for line in f]
+        usernames = {r[0] for r in rows}
+        ids = {r[2] for r in rows}
+        
+        print(f"{processes} processes, {total_names:,} names, {processes * total_names:,} attempts")
+        print(f"  registered:          {registered:,}")
+        print(f"  duplicate usernames: {len(rows) - len(usernames)}")
+        print(f"  duplicate ids:       {len(rows) - len(ids)}")
+        print(f"  attempts/s:          {processes * total_names / elapsed:,.0f}")
+        print(f"  registrations/s:     {registered / elapsed:,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+import json
+import math
+import os
+
+
+def stats_filename(data_filename):
+    """Where detector state for a data file is kept, e.g. finance_data.stats.json"""
+    return os.path.splitext(data_filename)[0] + ".stats.json"
+
+
+class P2Quantile:
+    """Streaming estimate of one quantile in O(1) memory (the P-square algorithm, Jain & Chlamtac 1985).
+
+    Keeps five markers whose heights are nudged toward the min, p/2, p,
+    (1+p)/2 quantiles and the max as values arrive; no values are stored
+    once five have been seen.
+    """
+
+    def __init__(self, p=0.99):
+        if not 0 < p < 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self.p = p
+        self.count = 0
+        self._heights = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._steps = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x):
+        self.count += 1
+        q = self._heights
+        if self.count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._steps[i]
+
+        # Move the three middle markers toward their desired positions
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    def value(self):
+        """Current estimate, or None before any values"""
+        if not self._heights:
+            return None
+        if self.count <= 5:
+            return self._heights[min(len(self._heights) - 1, int(self.p * len(self._heights)))]
+        return self._heights[2]
+
+    def to_dict(self):
+        return {"p": self.p, "count": self.count, "heights": self._heights,
+                "positions": self._positions, "desired": self._desired}
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(state["p"])
+        sketch.count = state["count"]
+        sketch._heights = list(state["heights"])
+        sketch._positions = list(state["positions"])
+        sketch._desired = list(state["desired"])
+        return sketch
+
+
+class CategoryStats:
+    """Running count, mean and variance (Welford) plus a high-quantile sketch for one category"""
+
+    def __init__(self, quantile=0.99):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.sketch = P2Quantile(quantile)
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        self.sketch.add(x)
+
+    @property
+    def std(self):
+        """Sample standard deviation, 0 with fewer than two values"""
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def to_dict(self):
+        return {"count": self.count, "mean": self.mean, "m2": self._m2, "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state):
+        stats = cls()
+        stats.count = state["count"]
+        stats.mean = state["mean"]
+        stats._m2 = state["m2"]
+        stats.sketch = P2Quantile.from_dict(state["sketch"])
+        return stats
+
+
+class AnomalyScore:
+    """How an expense compares with earlier expenses in its category"""
+
+    def __init__(self, category, amount, z_score, quantile_value, is_anomaly):
+        self.category = category
+        self.amount = amount
+        self.z_score = z_score  # None until the category has a spread
+        self.quantile_value = quantile_value  # estimated high quantile before this expense
+        self.is_anomaly = is_anomaly
+
+    def __repr__(self):
+        return (f"AnomalyScore(category={self.category!r}, amount={self.amount}, "
+                f"z_score={self.z_score}, is_anomaly={self.is_anomaly})")
+
+
+class AnomalyDetector:
+    """Flags unusually large expenses per category, updating in O(1) per expense.
+
+    An expense is flagged once its category has min_samples earlier
+    expenses, when it is more than z_threshold standard deviations above
+    the category mean and also above the category's estimated `quantile`.
+    Requiring both keeps one-off spikes in skewed categories from tripping
+    the z-score alone.
+
+    `seen` counts every expense folded in, so an owner that persists the
+    state with save() only needs to backfill the records after `seen`
+    on restart.
+    """
+
+    def __init__(self, z_threshold=3.0, quantile=0.99, min_samples=10):
+        self.z_threshold = z_threshold
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.seen = 0
+        self._categories = {}
+
+    def score(self, category, amount):
+        """Scores an expense against the current statistics without recording it"""
+        stats = self._categories.get(category)
+        if stats is None:
+            return AnomalyScore(category, amount, None, None, False)
+        std = stats.std
+        z_score = (amount - stats.mean) / std if std > 0 else None
+        quantile_value = stats.sketch.value()
+        is_anomaly = (stats.count >= self.min_samples and z_score is not None
+                      and z_score > self.z_threshold and amount > quantile_value)
+        return AnomalyScore(category, amount, z_score, quantile_value, is_anomaly)
+
+    def update(self, category, amount):
+        """Records an expense without scoring it"""
+        stats = self._categories.get(category)
+        if stats is None:
+            stats = self._categories[category] = CategoryStats(self.quantile)
+        stats.add(amount)
+        self.seen += 1
+
+    def observe(self, category, amount):
+        """Scores an expense against earlier ones, then records it"""
+        result = self.score(category, amount)
+        self.update(category, amount)
+        return result
+
+    def backfill(self, records):
+        """Records existing history without scoring.
+
+        Records are (category, amount) pairs, expense dicts or objects with category and amount.
+        """
+        update = self.update
+        for record in records:
+            if isinstance(record, dict):
+                update(record["category"], record["amount"])
+            elif isinstance(record, tuple):
+                update(*record)
+            else:
+                update(record.category, record.amount)
+        return self.seen
+
+    def catch_up(self, records):
+        """Backfills the records after the first `seen`, e.g. after loading saved state.
+
+        Starts over if there are fewer records than `seen`, since the history was replaced.
+        """
+        if self.seen > len(records):
+            self.reset()
+        return self.backfill(records[self.seen:])
+
+    def reset(self):
+        """Forgets all statistics, keeping the settings"""
+        self.seen = 0
+        self._categories = {}
+
+    def stats(self, category):
+        """The CategoryStats for a category, or None if it has not been seen"""
+        return self._categories.get(category)
+
+    def to_dict(self):
+        return {
+            "z_threshold": self.z_threshold,
+            "quantile": self.quantile,
+            "min_samples": self.min_samples,
+            "seen": self.seen,
+            "categories": {c: s.to_dict() for c, s in self._categories.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        detector = cls(state["z_threshold"], state["quantile"], state["min_samples"])
+        detector.seen = state["seen"]
+        detector._categories = {c: CategoryStats.from_dict(s) for c, s in state["categories"].items()}
+        return detector
+
+    def save(self, filename):
+        """Writes the state atomically (temp file then rename)"""
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, "w") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(cls, filename, **settings):
+        """Reads saved state, or returns a fresh detector built with settings if there is none or it is unreadable"""
+        try:
+            with open(filename) as f:
+                return cls.from_dict(json.load(f))
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return cls(**settings)
@@ -1,36 +1,100 @@
 import os
 from datetime import datetime
 from collections import Counter
-from Classes import User, ExpenseTracker, Finance
+from User import User
+from ExpenseTracker import ExpenseTracker
+from spending_trends import spending_trends
 
 class BudgetAnalyzer:
-    """Analyzes spending patterns and overall budget health."""
+    """Analyzes spending patterns and overall budget health.
 
-    def __init__(self, user: User, tracker: ExpenseTracker, finance: Finance):
+    finance is any object with a salary and calculate_after_tax_income().
+    Spending aggregates are computed once per tracker.version. After-tax
+    income is cached the same way only if finance has a version of its own
+    that changes whenever its inputs do (salary, tax rate, state, ...);
+    otherwise it is recomputed on every snapshot, once per report.
+    analyze_spending_trends takes its own transaction list, so the
+    constructor arguments are optional.
+    """
+
+    def __init__(self, user: User = None, tracker: ExpenseTracker = None, finance=None):
         self.user = user
         self.tracker = tracker
         self.finance = finance
+        self._spending_key = None
+        self._spending = None
+        self._after_tax_key = None
+        self._after_tax = None
+        self._report_key = None
+        self._report = None
+        self._trends_key = None
+        self._trends = None
+
+    @staticmethod
+    def _version_of(source):
+        """Identifies the current state of a versioned source, or None if it has no version."""
+        version = getattr(source, "version", None)
+        if version is None:
+            return None
+        return (id(source), version)
+
+    def snapshot(self):
+        """Returns after_tax, total_spent, balance and most_frequent_category.
+
+        Spending figures are computed at most once per tracker version, after_tax at most
+        once per finance version (every call if finance is unversioned).
+        """
+        key = self._version_of(self.tracker)
+        if key is None or key != self._spending_key:
+            self._spending = (self.tracker.get_total_spending(), self.tracker.get_most_frequent_category())
+            self._spending_key = key
+        key = self._version_of(self.finance)
+        if key is None or key != self._after_tax_key:
+            self._after_tax = self.finance.calculate_after_tax_income()
+            self._after_tax_key = key
+        total_spent, most_frequent = self._spending
+        return {
+            "after_tax": self._after_tax,
+            "total_spent": total_spent,
+            "balance": self._after_tax - total_spent,
+            "most_frequent_category": most_frequent,
+        }
 
     def calculate_budget_balance(self):
         """Returns remaining balance after expenses."""
-        after_tax = self.finance.calculate_after_tax_income()
-        total_spent = self.tracker.get_total_spending()
-        return after_tax - total_spent
+        return self.snapshot()["balance"]
+
+    def analyze_spending_trends(self, transactions):
+        """Per-category monthly totals, month-over-month changes, growth and 3/6/12-month rolling averages.
+
+        Transactions are dicts or objects with date, amount and category; see spending_trends.
+        """
+        return spending_trends(transactions)
 
     def detect_spending_trends(self):
-        """Placeholder for trend analysis (can expand later)."""
-        return self.tracker.get_most_frequent_category()
+        """Spending trends for the tracker's expenses, computed once per data version."""
+        key = self._version_of(self.tracker)
+        if key is None or key != self._trends_key:
+            self._trends = self.analyze_spending_trends(self.tracker)
+            self._trends_key = key
+        return self._trends
 
     def generate_report(self):
-        """Generates a summary of the user's monthly budget."""
-        balance = self.calculate_budget_balance()
-        trend = self.detect_spending_trends()
-        return (
+        """Generates a summary of the user's monthly budget; reused while tracker and finance versions are unchanged."""
+        tracker_key, finance_key = self._version_of(self.tracker), self._version_of(self.finance)
+        key = None
+        if tracker_key is not None and finance_key is not None:
+            key = (tracker_key, finance_key, self.user.username)
+            if key == self._report_key:
+                return self._report
+        data = self.snapshot()
+        self._report = (
             f"\n=== {self.user.username}'s Budget Report ===\n"
             f"Gross Income: ${self.finance.salary:,.2f}\n"
-            f"After-Tax Income: ${self.finance.calculate_after_tax_income():,.2f}\n"
-            f"Total Spending: ${self.tracker.get_total_spending():,.2f}\n"
-            f"Most Frequent Category: {trend}\n"
-            f"Remaining Balance: ${balance:,.2f}\n"
+            f"After-Tax Income: ${data['after_tax']:,.2f}\n"
+            f"Total Spending: ${data['total_spent']:,.2f}\n"
+            f"Most Frequent Category: {data['most_frequent_category']}\n"
+            f"Remaining Balance: ${data['balance']:,.2f}\n"
         )
-
+        self._report_key = key
+        return self._report
@@ -0,0 +1,202 @@
+import heapq
+from array import array
+from datetime import date
+from Expense import Expense
+from ExpenseTracker import append_since_checkpoint
+
+try:
+    import numpy as np
+except ImportError:  # aggregates fall back to plain Python loops
+    np = None
+
+
+class ColumnarExpenseTracker:
+    """Tracks expenses as typed columns instead of one Expense object each.
+
+    Amounts are kept in array('d'), dates as day ordinals, categories as
+    codes into a category table and descriptions as ids into a string
+    pool, so an expense costs about 20 bytes plus its (shared) strings.
+    Offers the ExpenseTracker API plus filter() and group-by helpers;
+    aggregates use NumPy when it is installed.
+    """
+
+    def __init__(self, _categories=None, _descriptions=None):
+        self._amounts = array('d')
+        self._days = array('i')
+        self._category_codes = array('I')
+        self._description_ids = array('I')
+        # Lookup tables are shared with trackers returned by filter()
+        self._categories, self._category_ids = _categories or ([], {})
+        self._descriptions, self._description_pool = _descriptions or ([], {})
+        # Running aggregates kept current by add()
+        self._total = 0
+        self._category_counts = {}  # category code -> [count, amount]
+        self._checkpoints = {}
+        # Bumped on every change so callers can cache derived results
+        self.version = 0
+
+    def add_expense(self, expense: Expense):
+        if not isinstance(expense, Expense):
+            raise TypeError("Expected an Expense object.")
+        self._append(expense.amount, expense.category, expense.description, expense.date.toordinal())
+
+    def add(self, amount: float, category: str, description: str, date_value):
+        """Adds an expense without building an Expense object; date is a date or YYYY-MM-DD string."""
+        amount = Expense._validate_amount(amount)
+        if isinstance(date_value, str):
+            try:
+                date_value = date.fromisoformat(date_value)
+            except ValueError:
+                raise ValueError("Invalid date format. Use YYYY-MM-DD.")
+        self._append(amount, category.strip(), description.strip(), date_value.toordinal())
+
+    def _append(self, amount, category, description, day):
+        code = self._category_ids.get(category)
+        if code is None:
+            code = self._category_ids[category] = len(self._categories)
+            self._categories.append(category)
+        desc_id = self._description_pool.get(description)
+        if desc_id is None:
+            desc_id = self._description_pool[description] = len(self._descriptions)
+            self._descriptions.append(description)
+
+        self._amounts.append(amount)
+        self._days.append(day)
+        self._category_codes.append(code)
+        self._description_ids.append(desc_id)
+        self.version += 1
+
+        self._total += amount
+        stats = self._category_counts.get(code)
+        if stats is None:
+            self._category_counts[code] = [1, amount]
+        else:
+            stats[0] += 1
+            stats[1] += amount
+
+    def get_total_spending(self):
+        """Calculates total money spent."""
+        return self._total
+
+    def get_most_frequent_category(self):
+        """Finds most frequent spending category."""
+        if not self._category_counts:
+            return None
+        code = max(self._category_counts, key=lambda c: self._category_counts[c][0])
+        return self._categories[code]
+
+    def top_categories(self, k=3):
+        """Returns the k most frequent categories as (category, count) pairs."""
+        stats = self._category_counts
+        return [(self._categories[c], stats[c][0]) for c in heapq.nlargest(k, stats, key=lambda c: stats[c][0])]
+
+    def get_category_spending(self):
+        """Returns total amount spent per category."""
+        return {self._categories[c]: amount for c, (count, amount) in self._category_counts.items()}
+
+    def expense(self, i):
+        """Builds the Expense object for row i."""
+        e = Expense.__new__(Expense)
+        e.amount = self._amounts[i]
+        e.category = self._categories[self._category_codes[i]]
+        e.description = self._descriptions[self._description_ids[i]]
+        e.date = date.fromordinal(self._days[i])
+        return e
+
+    def filter(self, category=None, start=None, end=None, min_amount=None, max_amount=None):
+        """Returns a new tracker with the rows matching every given condition (dates inclusive)."""
+        rows = self._matching_rows(category, start, end, min_amount, max_amount)
+        subset = ColumnarExpenseTracker((self._categories, self._category_ids),
+                                        (self._descriptions, self._description_pool))
+        amounts, days, codes, desc_ids = self._amounts, self._days, self._category_codes, self._description_ids
+        for i in rows:
+            subset._append(amounts[i], self._categories[codes[i]], self._descriptions[desc_ids[i]], days[i])
+        return subset
+
+    def _matching_rows(self, category, start, end, min_amount, max_amount):
+        if category is not None and category not in self._category_ids:
+            return []
+        code = self._category_ids.get(category)
+        lo = self._ordinal(start)
+        hi = self._ordinal(end)
+
+        if np is not None:
+            amounts = np.frombuffer(self._amounts, dtype=np.float64)
+            days = np.frombuffer(self._days, dtype=np.int32)
+            mask = np.ones(len(self._amounts), dtype=bool)
+            if code is not None:
+                mask &= np.frombuffer(self._category_codes, dtype=np.uint32) == code
+            if lo is not None:
+                mask &= days >= lo
+            if hi is not None:
+                mask &= days <= hi
+            if min_amount is not None:
+                mask &= amounts >= min_amount
+            if max_amount is not None:
+                mask &= amounts <= max_amount
+            return np.flatnonzero(mask).tolist()
+
+        return [i for i, (amount, day, c) in enumerate(zip(self._amounts, self._days, self._category_codes))
+                if (code is None or c == code)
+                and (lo is None or day >= lo) and (hi is None or day <= hi)
+                and (min_amount is None or amount >= min_amount)
+                and (max_amount is None or amount <= max_amount)]
+
+    @staticmethod
+    def _ordinal(value):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = date.fromisoformat(value)
+        return value.toordinal()
+
+    def group_by_category(self):
+        """Returns {category: total amount}, computed from the columns."""
+        if np is not None and len(self._amounts):
+            sums = np.bincount(np.frombuffer(self._category_codes, dtype=np.uint32),
+                               weights=np.frombuffer(self._amounts, dtype=np.float64))
+            return {self._categories[c]: float(sums[c]) for c in self._category_counts}
+        totals = {}
+        for amount, code in zip(self._amounts, self._category_codes):
+            totals[code] = totals.get(code, 0) + amount
+        return {self._categories[c]: amount for c, amount in totals.items()}
+
+    def group_by_month(self):
+        """Returns {(year, month): total amount} in chronological order."""
+        if np is not None and len(self._amounts):
+            unique_days, inverse = np.unique(np.frombuffer(self._days, dtype=np.int32), return_inverse=True)
+            sums = np.bincount(inverse, weights=np.frombuffer(self._amounts, dtype=np.float64))
+            totals = {}
+            for day, amount in zip(unique_days.tolist(), sums.tolist()):
+                d = date.fromordinal(day)
+                totals[(d.year, d.month)] = totals.get((d.year, d.month), 0) + amount
+            return totals
+        totals = {}
+        month_of_day = {}
+        for amount, day in zip(self._amounts, self._days):
+            key = month_of_day.get(day)
+            if key is None:
+                d = date.fromordinal(day)
+                key = month_of_day[day] = (d.year, d.month)
+            totals[key] = totals.get(key, 0) + amount
+        return dict(sorted(totals.items()))
+
+    def save_to_file(self, filename="monthly_spending.txt", fsync=False):
+        """Appends expenses added since the last save to this file (all of them the first time)."""
+        def lines_from(start):
+            return [f"{e.date},{e.amount},{e.category},{e.description}\n"
+                    for e in map(self.expense, range(start, len(self)))]
+        append_since_checkpoint(self._checkpoints, filename, len(self), lines_from, fsync)
+
+    def __len__(self):
+        return len(self._amounts)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.expense(i)
+
+    def __str__(self):
+        return f"Total Expenses: ${self.get_total_spending():,.2f}"
+
+    def __repr__(self):
+        return f"ColumnarExpenseTracker({len(self)} expenses)"
@@ -1,16 +1,54 @@
 import os
-from datetime import datetime
+from datetime import datetime, date
 from collections import Counter
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str):
+    """Parses YYYY-MM-DD; cached because imported statements repeat the same dates."""
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        return date.fromisoformat(date_str)
+    # Non zero-padded dates such as 2024-1-5 still go through strptime
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
 
 class Expense:
     """Represents a single spending transaction."""
 
+    __slots__ = ("amount", "category", "description", "date")
+
     def __init__(self, amount: float, category: str, description: str, date: str):
         self.amount = self._validate_amount(amount)
         self.category = category.strip()
         self.description = description.strip()
         self.date = self._validate_date(date)
 
+    @classmethod
+    def from_records(cls, rows):
+        """Builds many expenses at once from dicts (as in to_dict) or
+        (amount, category, description, date) tuples, validating as it goes."""
+        new = cls.__new__
+        expenses = []
+        for i, row in enumerate(rows):
+            if isinstance(row, dict):
+                amount, category, description, date_str = row["amount"], row["category"], row["description"], row["date"]
+            else:
+                amount, category, description, date_str = row
+            if amount <= 0:
+                raise ValueError(f"Row {i}: Expense amount must be positive.")
+            try:
+                parsed = _parse_date(date_str)
+            except (TypeError, ValueError):
+                raise ValueError(f"Row {i}: Invalid date format. Use YYYY-MM-DD.")
+            e = new(cls)
+            e.amount = amount
+            e.category = category.strip()
+            e.description = description.strip()
+            e.date = parsed
+            expenses.append(e)
+        return expenses
+
     @staticmethod
     def _validate_amount(amount):
         if amount <= 0:
@@ -20,8 +58,8 @@ class Expense:
     @staticmethod
     def _validate_date(date_str):
         try:
-            return datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
+            return _parse_date(date_str)
+        except (TypeError, ValueError):
             raise ValueError("Invalid date format. Use YYYY-MM-DD.")
 
     def to_dict(self):
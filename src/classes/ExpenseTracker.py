@@ -1,35 +1,205 @@
 import os
+import heapq
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from collections import Counter
-from Classes import Expense
+from operator import attrgetter
+from Expense import Expense
+from SpaceSavingCounter import SpaceSavingCounter
+from AnomalyDetector import AnomalyDetector, stats_filename
+
+def append_since_checkpoint(checkpoints, filename, count, lines_from, fsync=False):
+    """Appends rows added since filename's checkpoint, then moves the checkpoint to count.
+
+    checkpoints maps an absolute path to (rows saved, file size after saving, whole),
+    where whole means the file holds those rows and nothing else;
+    lines_from(start) returns the text lines for rows start..count-1.
+    Returns whole.
+    """
+    key = os.path.abspath(filename)
+    saved, size, whole = checkpoints.get(key, (0, None, False))
+    try:
+        current_size = os.path.getsize(filename)
+    except FileNotFoundError:
+        current_size = None
+    if size is not None and (current_size is None or current_size < size):
+        # The file was deleted or truncated since the checkpoint, so write everything again
+        saved = 0
+    if saved == 0:
+        # Rows written from the start are the whole file only if it was missing or empty
+        whole = not current_size
+    elif current_size != size:
+        # Someone else appended since the checkpoint
+        whole = False
+
+    if saved < count:
+        # One buffered write for the whole delta
+        with open(filename, "a") as f:
+            f.write("".join(lines_from(saved)))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    checkpoints[key] = (count, os.path.getsize(filename) if os.path.exists(filename) else None, whole)
+    return whole
+
 
 class ExpenseTracker:
     """Tracks and analyzes user expenses."""
 
-    def __init__(self):
+    def __init__(self, max_categories=None, anomaly_detector=None):
+        """max_categories bounds the category frequency table (see SpaceSavingCounter);
+        with an AnomalyDetector, add_expense scores each expense against earlier ones."""
         self._expenses = []
+        # Running aggregates kept current by add_expense
+        self._total = 0
+        self._category_stats = {}  # category -> [count, amount]
+        self._category_counter = SpaceSavingCounter(max_categories) if max_categories else None
+        # Bumped on every change so callers can cache derived results
+        self.version = 0
+        self.anomaly_detector = anomaly_detector
+        # Date-sorted view of _expenses; out-of-order adds wait in _pending_by_date
+        self._by_date = []
+        self._date_keys = []
+        self._pending_by_date = []
+        # Per-file high-water marks so save_to_file only appends what is new
+        self._checkpoints = {}
 
     def add_expense(self, expense: Expense):
         if not isinstance(expense, Expense):
             raise TypeError("Expected an Expense object.")
         self._expenses.append(expense)
+        self.version += 1
+        self._total += expense.amount
+        stats = self._category_stats.get(expense.category)
+        if stats is None:
+            self._category_stats[expense.category] = [1, expense.amount]
+        else:
+            stats[0] += 1
+            stats[1] += expense.amount
+        if self._category_counter is not None:
+            self._category_counter.add(expense.category)
+        if not self._pending_by_date and (not self._date_keys or expense.date >= self._date_keys[-1]):
+            self._by_date.append(expense)
+            self._date_keys.append(expense.date)
+        else:
+            self._pending_by_date.append(expense)
+        if self.anomaly_detector is not None:
+            return self.anomaly_detector.observe(expense.category, expense.amount)
+
+    def _sorted_by_date(self):
+        """Folds pending out-of-order expenses into the date-sorted list."""
+        pending = self._pending_by_date
+        if len(pending) <= 64:
+            # A few late expenses: insort each into both lists (a C memmove, not a Python rebuild)
+            by_date, keys = self._by_date, self._date_keys
+            for expense in pending:
+                i = bisect_right(keys, expense.date)
+                keys.insert(i, expense.date)
+                by_date.insert(i, expense)
+        else:
+            # Many: two sorted runs, so timsort merges them in linear time; ties keep insertion order
+            pending.sort(key=attrgetter("date"))
+            self._by_date.extend(pending)
+            self._by_date.sort(key=attrgetter("date"))
+            self._date_keys = [e.date for e in self._by_date]
+        self._pending_by_date = []
+        return self._by_date
+
+    def _date_range(self, start, end):
+        by_date = self._sorted_by_date()
+        if isinstance(start, str): start = Expense._validate_date(start)
+        if isinstance(end, str): end = Expense._validate_date(end)
+        return by_date, bisect_left(self._date_keys, start), bisect_right(self._date_keys, end)
+
+    def expenses_between(self, start, end):
+        """Returns expenses dated from start through end (dates or YYYY-MM-DD), oldest first."""
+        by_date, lo, hi = self._date_range(start, end)
+        return by_date[lo:hi]
+
+    def spending_between(self, start, end, category=None):
+        """Total spent from start through end, optionally in one category."""
+        by_date, lo, hi = self._date_range(start, end)
+        if category is None:
+            return sum(by_date[i].amount for i in range(lo, hi))
+        return sum(by_date[i].amount for i in range(lo, hi) if by_date[i].category == category)
+
+    def latest(self, n=5):
+        """Returns the n most recent expenses by date, newest first."""
+        if n <= 0:
+            return []
+        return self._sorted_by_date()[-n:][::-1]
 
     def get_total_spending(self):
         """Calculates total money spent."""
-        return sum(e.amount for e in self._expenses)
+        return self._total
 
     def get_most_frequent_category(self):
         """Finds most frequent spending category."""
-        if not self._expenses:
+        if self._category_counter is not None:
+            return self._category_counter.most_frequent()
+        if not self._category_stats:
             return None
-        categories = [e.category for e in self._expenses]
-        return Counter(categories).most_common(1)[0][0]
+        # max() keeps the first category seen on ties, like Counter.most_common
+        return max(self._category_stats, key=lambda c: self._category_stats[c][0])
 
-    def save_to_file(self, filename="monthly_spending.txt"):
-        """Appends all expenses to a local file."""
-        with open(filename, "a") as f:
-            for e in self._expenses:
-                f.write(f"{e.date},{e.amount},{e.category},{e.description}\n")
+    def top_categories(self, k=3):
+        """Returns the k most frequent categories as (category, count) pairs.
+
+        With max_categories set, counts are Space-Saving estimates (never below the true count).
+        """
+        if self._category_counter is not None:
+            return [(c, count) for c, count, error in self._category_counter.top(k)]
+        stats = self._category_stats
+        return [(c, stats[c][0]) for c in heapq.nlargest(k, stats, key=lambda c: stats[c][0])]
+
+    def get_category_spending(self):
+        """Returns total amount spent per category."""
+        return {c: amount for c, (count, amount) in self._category_stats.items()}
+
+    def save_to_file(self, filename="monthly_spending.txt", fsync=False):
+        """Appends expenses added since the last save to this file (all of them the first time).
+
+        Set fsync=True to force the data to disk before returning. Anomaly statistics,
+        if any, are saved next to the file as <name>.stats.json, but only when they cover
+        exactly the file's rows (the tracker was loaded from the file or started it);
+        otherwise the stats already there are left for load_from_file to catch up.
+        """
+        expenses = self._expenses
+        whole = append_since_checkpoint(
+            self._checkpoints, filename, len(expenses),
+            lambda start: [f"{e.date},{e.amount},{e.category},{e.description}\n" for e in expenses[start:]],
+            fsync)
+        if self.anomaly_detector is not None and whole and self.anomaly_detector.seen == len(expenses):
+            self.anomaly_detector.save(stats_filename(filename))
+
+    @classmethod
+    def load_from_file(cls, filename="monthly_spending.txt", detect_anomalies=False):
+        """Rebuilds a tracker from a file written by save_to_file; lines that are not valid expenses are skipped.
+
+        The loaded expenses count as already saved, so a later save_to_file only appends new ones.
+        With detect_anomalies, saved anomaly statistics are loaded and only expenses after them are backfilled.
+        """
+        tracker = cls()
+        with open(filename, "r") as f:
+            for line in f:
+                parts = line.rstrip("\n").split(",", 3)
+                if len(parts) != 4:
+                    continue
+                try:
+                    tracker.add_expense(Expense(float(parts[1]), parts[2], parts[3], parts[0]))
+                except ValueError:
+                    continue
+        tracker._checkpoints[os.path.abspath(filename)] = (len(tracker._expenses), os.path.getsize(filename), True)
+        if detect_anomalies:
+            tracker.anomaly_detector = AnomalyDetector.load(stats_filename(filename))
+            tracker.anomaly_detector.catch_up(tracker._expenses)
+        return tracker
+
+    def __len__(self):
+        return len(self._expenses)
+
+    def __iter__(self):
+        return iter(self._expenses)
 
     def __str__(self):
         return f"Total Expenses: ${self.get_total_spending():,.2f}"
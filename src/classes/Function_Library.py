@@ -1,21 +1,19 @@
-#Create User ID 
-import os
-import random
+#BudgetBuddy function library. Importing this module does no I/O;
+#the interactive session lives in function_library_cli.py.
 
-def username_creation():
+#Create User ID 
+#Appends, so earlier usernames in the file are kept
+def username_creation(file_name="users.txt"):
     while True:
         username = input("Please make your username: ")
         print(f"You have entered: {username}")
-        file_name = "users.txt"
         try:
-            with open(file_name, 'w') as file:
-                file.write(username)
+            with open(file_name, 'a') as file:
+                file.write(username + "\n")
             print(f"Your answer has been saved to '{file_name}' successfully.")
-            break
+            return username
         except IOError as e:
                 print(f"Error writing to file: {e}")
-
-username_creation()
     
 def is_username_taken_from_file(username, filename="users.txt"):
     try:
@@ -29,16 +27,8 @@ def is_username_taken_from_file(username, filename="users.txt"):
     except FileNotFoundError:
         return False # No file means no users, so username is available
 
-new_username = input("Enter a desired username: ")
-if is_username_taken_from_file(new_username):
-    print("This username is already taken. Please choose another.")
-else:
-    print("Username is available!")
-    # Optionally, add the new username to the file
-    with open("users.txt", "a") as f:
-        f.write(new_username + "\n")
-
 def generate_unique_identifier():
+    import random
     random_int = random.randint(100000, 999999)
     print(f"Random integer: {random_int}")
     
@@ -56,29 +46,13 @@ def get_numeric_input(prompt):
         except ValueError:
             print("Invalid input. Please enter a valid number.")
 
-
-
-#User input monthly income
-income = input("Please enter your income for this month: ")
-income = float(income)
-#User input monthly spending
-spending = input("Please enter your spending for this month: ")
-spending = float(spending)
 #How will the data be stored/saved?
-with open("budget.txt", "a") as file:
-  file.write(f"Income: {income}, Spending: {spending}\n")
+def log_monthly_budget(income, spending, filename="budget.txt"):
+    with open(filename, "a") as file:
+      file.write(f"Income: {income}, Spending: {spending}\n")
 
 #Categorize spendings into different groups (Ex. Food, Rent, entertainment)
-print("\nEnter your spending for the following categories:")
-categories = ["Rent & Utilities", "Groceries", "Transportation", "Entertainment", "Other"]
-spending_by_category = {}
-
-for category in categories:
-    amount = float(input(f"How much did you spend on {category}? $"))
-    spending_by_category[category] = amount
-
-total_category_spending = sum(spending_by_category.values())
-print(f"\n You have spent a total of ${total_category_spending:.2f} this month.")
+spending_categories = ["Rent & Utilities", "Groceries", "Transportation", "Entertainment", "Other"]
 
 
 
@@ -129,7 +103,7 @@ def purchase_category():
 
 #Input state to determine state taxes
 #Ask for state that  the user lives in to deduct state taxes and log monthly budget.
-states = ["Alabama", "Alaska", "Arizona" "Arkansas", "California", "Colorado",
+states = ["Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
 "Connecticut", "Delaware", "Florida","Georgia", "Hawaii", "Idaho","Illinois","Indiana",
 "Iowa","Kansas", "Kentucky", "Louisiana","Maine", "Maryland", "Massachusetts", "Michigan",
 "Minnesota","Mississippi","Missouri","Montana", "Nebraska","Nevada","New Hampshire",
@@ -158,45 +132,16 @@ def calculate_money_available_after_tax(salary, tax_rate):
     tax_amount = salary * tax_rate
     available = salary - tax_amount
     return available
-#Get user input for salary and tax rate
-salary = float(input("Enter your salary: "))
-tax_rate = float(input("Enter your tax rate (0-1): "))
-available = calculate_money_available_after_tax(salary, tax_rate)
-print(f"Money available after tax: ${available:,.2f}")
 
 #Tracks and stores user monthly spending
 def track_monthly_spending(amount, category, description, month):
     with open("monthly_spending.txt", "a") as file:
         file.write(f"{month},{amount},{category},{description}\n")
 
-#gets user input for spending information (Categorization #3)
-amount = float(input("Enter amount spent: "))
-category = input("Enter spending category: ")
-description = input("Enter a short description: ")
-month = input("Enter the month: ")
-track_monthly_spending(amount, category, description, month)
-print("Spending record added")
-
-#gets most frequent transation category
-from collections import Counter
-def get_most_frequent_transaction_category():
-    categories = []
-    try:
-        with open("monthly_spending.txt", "r") as file:
-            for line in file:
-                parts = line.strip().split(",", 3)
-                if len(parts) >= 3:
-                    categories.append(parts[2])  
-    except FileNotFoundError:
-        return None
-    if not categories:
-        return None
-    counter = Counter(categories)
-    most_common = counter.most_common(1)
-    return most_common[0][0] if most_common else None
-    
-most_frequent = get_most_frequent_transaction_category()
-if most_frequent:
-    print(f"Most frequent transaction category: {most_frequent}")
-else:
-    print("No transactions found.")
+#gets most frequent transation category (shares Transaction's cached parse of the file)
+#max_categories caps memory for free-text categories (approximate past that many distinct values)
+def get_most_frequent_transaction_category(filename="monthly_spending.txt", max_categories=None):
+    #Imported here so loading the library stays cheap
+    from Transaction import Transaction
+    return Transaction.get_most_frequent_category(filename, max_categories)
+
@@ -0,0 +1,83 @@
+import heapq
+from itertools import count as _sequence
+
+
+class SpaceSavingCounter:
+    """Approximate top-k counter that never tracks more than `capacity` distinct items.
+
+    Uses the Space-Saving algorithm (Metwally et al., 2005). When a new
+    item arrives and the table is full, the item with the smallest count
+    is evicted and the newcomer inherits that count, remembered as its
+    error. After N additions:
+
+    - each reported count overestimates the true count by at most its
+      error, and every error is at most N / capacity;
+    - any item seen more than N / capacity times is always in the table;
+    - with at most `capacity` distinct items, every count is exact.
+
+    Ties are reported in the order items entered the table, so with exact
+    counts the answers match Counter.most_common.
+    """
+
+    def __init__(self, capacity=1000):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self._counts = {}  # item -> [count, error]
+        self._heap = []  # (count, seq, item); entries go stale when the item's count changes
+        self._seq = _sequence()
+
+    def add(self, item, count=1):
+        """Counts item `count` more times."""
+        self.total += count
+        entry = self._counts.get(item)
+        if entry is None:
+            if len(self._counts) < self.capacity:
+                entry = self._counts[item] = [0, 0]
+            else:
+                floor = self._pop_min()
+                entry = self._counts[item] = [floor, floor]
+        entry[0] += count
+        heapq.heappush(self._heap, (entry[0], next(self._seq), item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(e[0], next(self._seq), i) for i, e in self._counts.items()]
+            heapq.heapify(self._heap)
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def _pop_min(self):
+        """Evicts the item with the smallest count and returns that count."""
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            entry = self._counts.get(item)
+            if entry is not None and entry[0] == count:
+                del self._counts[item]
+                return count
+
+    def top(self, k=3):
+        """Returns up to k (item, count, error) triples, most frequent first; the true count is in [count - error, count]."""
+        counts = self._counts
+        return [(item, counts[item][0], counts[item][1])
+                for item in heapq.nlargest(k, counts, key=lambda i: counts[i][0])]
+
+    def most_frequent(self):
+        """The item with the highest count, or None if nothing was added."""
+        if not self._counts:
+            return None
+        return max(self._counts, key=lambda i: self._counts[i][0])
+
+    def max_error(self):
+        """Upper bound on the overcount of any reported item."""
+        return self.total / self.capacity
+
+    def __contains__(self, item):
+        return item in self._counts
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __repr__(self):
+        return f"SpaceSavingCounter(capacity={self.capacity}, tracked={len(self)}, total={self.total})"
@@ -1,4 +1,104 @@
+import os
+import time
 from collections import Counter
+from SpaceSavingCounter import SpaceSavingCounter
+
+# Parsed contents of spending files, keyed by absolute path
+_PARSED_FILES = {}
+
+
+class _ParsedFile:
+    """Everything parsed so far from one spending file, which is treated as append-only."""
+
+    def __init__(self):
+        self.signature = None  # (mtime_ns, size) when last read
+        self.inode = None
+        self.offset = 0  # bytes of complete lines already parsed
+        self.prefix_tail = b""  # last bytes before offset, checked before trusting the parsed prefix
+        self.records = []  # (month, amount text, category, description) for 4-field lines
+        self.categories = Counter()  # category counts for lines with 3+ fields
+        self.partial = ""  # trailing line without a newline yet, re-read on the next change
+        self._transactions = []
+        self._most_frequent = None
+
+    def consume(self, data):
+        """Parses newly appended bytes."""
+        complete, newline, partial = data.rpartition(b"\n")
+        if newline:
+            for line in complete.decode("utf-8").split("\n"):
+                self._parse_line(line, self.records, self.categories)
+            self.offset += len(complete) + 1
+            self.prefix_tail = (self.prefix_tail + complete + newline)[-64:]
+        self.partial = partial.decode("utf-8", errors="replace")
+        self._most_frequent = None
+
+    @staticmethod
+    def _parse_line(line, records, categories):
+        parts = line.strip().split(",", 3)
+        if len(parts) >= 3:
+            categories[parts[2]] += 1
+        if len(parts) == 4:
+            records.append(tuple(parts))
+
+    def transactions(self):
+        """Transaction objects for every record, built once and reused across calls."""
+        built = self._transactions
+        for month, amount, category, description in self.records[len(built):]:
+            built.append(Transaction(float(amount), category, description, month))
+        result = list(built)
+        if self.partial:
+            tail = []
+            self._parse_line(self.partial, tail, Counter())
+            result.extend(Transaction(float(a), c, d, m) for m, a, c, d in tail)
+        return result
+
+    def most_frequent_category(self):
+        if self._most_frequent is None:
+            counts = self.categories
+            if self.partial:
+                counts = counts.copy()
+                self._parse_line(self.partial, [], counts)
+            most_common = counts.most_common(1)
+            self._most_frequent = (most_common[0][0] if most_common else None,)
+        return self._most_frequent[0]
+
+
+def _load_parsed(filename):
+    """Returns the cached parse of filename, reading only bytes appended since the last call.
+
+    The tail is only read if the file has the same inode and the bytes just before the
+    parsed offset are unchanged; any other rewrite is parsed from scratch.
+    Returns None if the file does not exist.
+    """
+    key = os.path.abspath(filename)
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        _PARSED_FILES.pop(key, None)
+        return None
+    signature = (st.st_mtime_ns, st.st_size)
+    entry = _PARSED_FILES.get(key)
+    if entry is not None and entry.signature == signature:
+        return entry
+    appended = entry is not None and entry.inode == st.st_ino and st.st_size >= entry.offset
+
+    with open(filename, "rb") as file:
+        if appended:
+            tail = entry.prefix_tail
+            file.seek(entry.offset - len(tail))
+            data = file.read()
+            appended = data.startswith(tail)
+            data = data[len(tail):]
+        if not appended:
+            entry = _ParsedFile()
+            file.seek(0)
+            data = file.read()
+    entry.consume(data)
+    entry.signature = signature
+    entry.inode = st.st_ino
+    _PARSED_FILES[key] = entry
+    return entry
+
 
 class Transaction:
     def __init__(self, amount, category, description, month):
@@ -7,46 +107,108 @@ class Transaction:
         self.description = description
         self.month = month
 
+    def to_line(self):
+        """The line format used in the spending file and read back by get_all_transactions."""
+        return f"{self.month},{self.amount},{self.category},{self.description}\n"
+
     def save(self, filename="monthly_spending.txt"):
         """Save this transaction to a text file."""
         with open(filename, "a") as file:
-            file.write(f"{self.month},{self.amount},{self.category},{self.description}\n")
+            file.write(self.to_line())
         print("Transaction saved successfully.")
 
+    @staticmethod
+    def save_many(transactions, filename="monthly_spending.txt", quiet=True):
+        """Save many transactions through one open file; prints a single summary unless quiet."""
+        with TransactionWriter(filename, quiet=quiet) as writer:
+            for transaction in transactions:
+                writer.write(transaction)
+        return writer.written
+
     @staticmethod
     def get_all_transactions(filename="monthly_spending.txt"):
-        """Load all transactions from file as a list of Transaction objects."""
-        transactions = []
-        try:
-            with open(filename, "r") as file:
-                for line in file:
-                    parts = line.strip().split(",", 3)
-                    if len(parts) == 4:
-                        month, amount, category, description = parts
-                        transactions.append(Transaction(float(amount), category, description, month))
-        except FileNotFoundError:
+        """Load all transactions from file as a list of Transaction objects.
+
+        The parsed file is cached, so repeated calls only read lines appended since the
+        last call. The Transaction objects in the list are shared between calls.
+        """
+        parsed = _load_parsed(filename)
+        if parsed is None:
             print("No transaction file found.")
-        return transactions
+            return []
+        return parsed.transactions()
 
     @staticmethod
-    def get_most_frequent_category(filename="monthly_spending.txt"):
-        """Find and return the most frequent spending category."""
-        categories = []
-        try:
+    def get_most_frequent_category(filename="monthly_spending.txt", max_categories=None):
+        """Find and return the most frequent spending category.
+
+        With max_categories set, the file is streamed through a SpaceSavingCounter that
+        tracks at most that many categories instead of using the cached full count.
+        The answer is exact while the file has no more distinct categories than that.
+        """
+        if max_categories is not None:
+            if not os.path.exists(filename):
+                return None
+            counter = SpaceSavingCounter(max_categories)
             with open(filename, "r") as file:
                 for line in file:
                     parts = line.strip().split(",", 3)
                     if len(parts) >= 3:
-                        categories.append(parts[2])
-        except FileNotFoundError:
+                        counter.add(parts[2])
+            return counter.most_frequent()
+        parsed = _load_parsed(filename)
+        if parsed is None:
             return None
+        return parsed.most_frequent_category()
 
-        if not categories:
-            return None
+class TransactionWriter:
+    """Keeps a spending file open and writes transactions in buffered batches.
+
+    Buffered lines are flushed once max_lines are waiting or flush_interval
+    seconds have passed since the last flush, and always on exit.
+    Use as a context manager:
+
+        with TransactionWriter("monthly_spending.txt") as writer:
+            writer.write(transaction)
+    """
+
+    def __init__(self, filename="monthly_spending.txt", max_lines=1000, flush_interval=1.0, quiet=True):
+        self.filename = filename
+        self.max_lines = max_lines
+        self.flush_interval = flush_interval
+        self.quiet = quiet
+        self.written = 0
+        self._buffer = []
+        self._file = None
+        self._last_flush = 0.0
 
-        counter = Counter(categories)
-        most_common = counter.most_common(1)
-        return most_common[0][0] if most_common else None
+    def __enter__(self):
+        self._file = open(self.filename, "a")
+        self._last_flush = time.monotonic()
+        return self
+
+    def write(self, transaction):
+        self._buffer.append(transaction.to_line())
+        if len(self._buffer) >= self.max_lines or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._file.flush()
+            self.written += len(self._buffer)
+            self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+            self._file = None
+        if not self.quiet:
+            print(f"{self.written} transactions saved successfully.")
+        return False
 
 def __str__(self):
         return (f"Month: {self.month}, "
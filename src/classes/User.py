@@ -1,5 +1,10 @@
 import os, random
-from typing import Optional
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, saves are only safe from one process
+    fcntl = None
 
 US_STATES = {s.strip() for s in (
     "Alabama, Alaska, Arizona, Arkansas, California, Colorado, Connecticut, Delaware, Florida, Georgia, "
@@ -10,6 +15,111 @@ US_STATES = {s.strip() for s in (
     "Vermont, Virginia, Washington, West Virginia, Wisconsin, Wyoming"
 ).split(",")}
 
+@contextmanager
+def storage_lock(storage_path: str) -> Iterator[None]:
+    """Hold an exclusive cross-process lock on '<storage_path>.lock' (creates the directory if missing)."""
+    d = os.path.dirname(storage_path)
+    if d and not os.path.exists(d): os.makedirs(d, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    with open(storage_path + ".lock", "a") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+class UserRegistry:
+    """In-memory username/user_id sets for one users.txt, reloaded only when the file changes."""
+    _registries: Dict[str, "UserRegistry"] = {}
+
+    def __init__(self, storage_path: str = "users.txt") -> None:
+        self._storage_path = storage_path
+        self._usernames: Set[str] = set()
+        self._user_ids: Set[str] = set()
+        self._signature: Optional[Tuple[int, int]] = None  # (mtime_ns, size) last loaded
+        self._offset = 0  # bytes of complete lines already indexed
+        self._inode: Optional[int] = None
+        self._prefix_tail = b""  # last bytes before _offset, checked before trusting the indexed prefix
+        # Entries of a last line without newline; replaced on every re-index since it may still grow
+        self._partial_usernames: Set[str] = set()
+        self._partial_user_ids: Set[str] = set()
+
+    @classmethod
+    def for_path(cls, storage_path: str = "users.txt") -> "UserRegistry":
+        """Shared registry for a storage file, so every User on that file reuses one index."""
+        key = os.path.abspath(storage_path)
+        if key not in cls._registries: cls._registries[key] = cls(storage_path)
+        return cls._registries[key]
+
+    def refresh(self) -> None:
+        """Re-index if users.txt changed; an append only reads the new tail, any rewrite reloads fully."""
+        try:
+            st = os.stat(self._storage_path)
+        except FileNotFoundError:
+            self._usernames.clear(); self._user_ids.clear()
+            self._partial_usernames, self._partial_user_ids = set(), set()
+            self._signature, self._offset, self._inode, self._prefix_tail = None, 0, None, b""
+            return
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self._signature: return
+        tail = self._prefix_tail
+        appended = self._signature is not None and st.st_ino == self._inode and st.st_size >= self._offset
+        with open(self._storage_path, "rb") as f:
+            if appended:
+                # Only trust the indexed prefix if the bytes just before the offset are unchanged
+                f.seek(self._offset - len(tail))
+                data = f.read()
+                appended = data.startswith(tail)
+                data = data[len(tail):]
+            if not appended:
+                self._usernames.clear(); self._user_ids.clear(); self._offset, tail = 0, b""
+                f.seek(0)
+                data = f.read()
+        complete = data.rfind(b"\n") + 1
+        self._index_lines(data[:complete], self._usernames, self._user_ids)
+        # A last line without newline counts until the next change, when it is re-read from _offset
+        self._partial_usernames, self._partial_user_ids = set(), set()
+        self._index_lines(data[complete:], self._partial_usernames, self._partial_user_ids)
+        self._offset += complete
+        self._prefix_tail = (tail + data[:complete])[-64:]
+        self._signature, self._inode = signature, st.st_ino
+
+    @staticmethod
+    def _index_lines(data: bytes, usernames: Set[str], user_ids: Set[str]) -> None:
+        for line in data.decode("utf-8").split("\n"):
+            parts = line.split(",")
+            name = parts[0].strip().lower()
+            if name: usernames.add(name)
+            if len(parts) >= 3 and parts[2].strip(): user_ids.add(parts[2].strip())
+
+    def has_username(self, username: str, refresh: bool = True) -> bool:
+        u = username.strip().lower()
+        if not u: return False
+        if refresh: self.refresh()
+        return u in self._usernames or u in self._partial_usernames
+
+    def has_user_id(self, user_id: str, refresh: bool = True) -> bool:
+        if refresh: self.refresh()
+        return user_id in self._user_ids or user_id in self._partial_user_ids
+
+    def allocate_user_ids(self, count: int) -> List[str]:
+        """Return `count` distinct unused 6-digit ids, drawn at random without retries."""
+        self.refresh()
+        taken = self._user_ids | self._partial_user_ids if self._partial_user_ids else self._user_ids
+        if count > 1_000_000 - len(taken): raise RuntimeError("Unable to generate a unique user_id")
+        # Sampling count + len(taken) distinct numbers guarantees at least `count` are free
+        picks = random.sample(range(1_000_000), min(1_000_000, count + len(taken)))
+        free = (cand for cand in (f"{n:06d}" for n in picks) if cand not in taken)
+        return [next(free) for _ in range(count)]
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._usernames) + len(self._partial_usernames - self._usernames)
+
+
 class User:
     """This class represents a user and makes a unique username."""
 #Cleans and validates username, checks if username exists, and creates/validates user name
@@ -20,6 +130,7 @@ class User:
         if self.is_username_taken(u, storage_path): raise ValueError("Username already exists")
         self._username = u
         self._state = self._clean_state(state)
+        self._generated_id = user_id is None
         if user_id is None:
             self._user_id = self._generate_user_id(storage_path)
         else:
@@ -46,24 +157,59 @@ class User:
     def storage_path(self) -> str: return self._storage_path
 
     def save(self) -> None:
-        """Append 'username,state,user_id' to storage; creates file/dir if missing."""
-        if self.is_username_taken(self._username, self._storage_path): raise ValueError("Username already exists")
-        d = os.path.dirname(self._storage_path)
-        if d and not os.path.exists(d): os.makedirs(d, exist_ok=True)
-        with open(self._storage_path, "a", encoding="utf-8") as f:
-            f.write(f"{self._username},{self._state or ''},{self._user_id}\n")
+        """Append 'username,state,user_id' to storage; creates file/dir if missing.
+
+        The uniqueness checks and the append run under storage_lock, so concurrent processes
+        cannot register the same username or id. A generated id taken in the meantime is replaced.
+        """
+        with storage_lock(self._storage_path):
+            registry = UserRegistry.for_path(self._storage_path)
+            if registry.has_username(self._username): raise ValueError("Username already exists")
+            if registry.has_user_id(self._user_id, refresh=False):
+                if not self._generated_id: raise ValueError("Invalid user_id")
+                self._user_id = registry.allocate_user_ids(1)[0]
+            with open(self._storage_path, "a", encoding="utf-8") as f:
+                f.write(f"{self._username},{self._state or ''},{self._user_id}\n")
+
+    @classmethod
+    def register(cls, username: str, state: Optional[str] = None, storage_path: str = "users.txt") -> "User":
+        """Create and save a user in one step; safe to call from several processes at once."""
+        user = cls(username, state, storage_path=storage_path)
+        user.save()
+        return user
+
+    @classmethod
+    def create_many(cls, records: Iterable, storage_path: str = "users.txt") -> List["User"]:
+        """Validate, assign ids to and save many users at once; nothing is written if any record is invalid.
+
+        Each record is a (username, state) tuple or a dict with 'username' and optional 'state'.
+        """
+        with storage_lock(storage_path):
+            registry = UserRegistry.for_path(storage_path)
+            registry.refresh()
+            cleaned, seen = [], set()
+            for rec in records:
+                if isinstance(rec, dict): username, state = rec.get("username"), rec.get("state")
+                else: username, state = rec[0], (rec[1] if len(rec) > 1 else None)
+                u = cls._clean_username(username)
+                if u.lower() in seen or registry.has_username(u, refresh=False): raise ValueError(f"Username already exists: {u}")
+                seen.add(u.lower())
+                cleaned.append((u, cls._clean_state(state)))
+
+            users = []
+            for (u, st), uid in zip(cleaned, registry.allocate_user_ids(len(cleaned))):
+                user = cls.__new__(cls)
+                user._storage_path, user._username, user._state, user._user_id = storage_path, u, st, uid
+                user._generated_id = True
+                users.append(user)
+            if users:
+                with open(storage_path, "a", encoding="utf-8") as f:
+                    f.write("".join(f"{x._username},{x._state or ''},{x._user_id}\n" for x in users))
+        return users
 
     @staticmethod
     def is_username_taken(username: str, storage_path: str = "users.txt") -> bool:
-        u = username.strip().lower()
-        if not u: return False
-        try:
-            with open(storage_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if (line.rstrip("\n").split(",")[0].strip().lower() == u): return True
-        except FileNotFoundError:
-            return False
-        return False
+        return UserRegistry.for_path(storage_path).has_username(username)
 
     @classmethod
     def _generate_user_id(cls, storage_path: str) -> str:
@@ -74,14 +220,7 @@ class User:
 
     @staticmethod
     def _is_user_id_taken(user_id: str, storage_path: str) -> bool:
-        try:
-            with open(storage_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    parts = line.rstrip("\n").split(",")
-                    if len(parts) >= 3 and parts[2].strip() == user_id: return True
-        except FileNotFoundError:
-            return False
-        return False
+        return UserRegistry.for_path(storage_path).has_user_id(user_id)
 
     @staticmethod
     def _clean_username(username: str) -> str:
@@ -1,7 +1,14 @@
 import json
 import csv
+import heapq
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 
 
 class FileHandler:
@@ -76,53 +83,156 @@ class FileHandler:
         date,description,amount,category
         2024-01-15,Grocery Store,150.00,Food
         
+        Invalid rows are skipped and reported in a single warning once the
+        file has been read.
+        
         Args:
             csv_filepath: Path to CSV file
         
         Returns:
             List of transaction dictionaries
         """
+        result = self.import_csv_with_report(csv_filepath, mode="skip")
+        if result.rejected_count:
+            print(f"Warning: {result.summary()}")
+        return result.transactions
+    
+    def import_csv_with_report(self, csv_filepath, mode="collect", max_samples=20):
+        """
+        Import transactions from a CSV file and report on rejected rows
+        
+        Args:
+            csv_filepath: Path to CSV file
+            mode: "strict" fails on the first invalid row, "skip" only counts
+                  invalid rows, "collect" also keeps a sample of them
+            max_samples: Maximum number of rejected rows kept in "collect" mode
+        
+        Returns:
+            ImportResult with the accepted transactions and rejection details
+        """
+        result = ImportResult(mode, max_samples)
+        result.transactions.extend(self.iter_transactions_from_csv(csv_filepath, report=result))
+        return result
+    
+    def iter_transactions_from_csv(self, csv_filepath, report=None):
+        """
+        Import transactions from a CSV file one row at a time
+        
+        Same format and validation as import_transactions_from_csv, but rows
+        are parsed as they are consumed, so memory use does not grow with
+        the size of the file.
+        
+        Args:
+            csv_filepath: Path to CSV file
+            report: Optional ImportResult that records rejected rows;
+                    without one, invalid rows are skipped silently
+        
+        Returns:
+            Iterator of transaction dictionaries
+        """
         csv_path = Path(csv_filepath)
         
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_filepath}")
         
-        transactions = []
+        if report is None:
+            report = ImportResult("skip")
+        return self._read_csv_rows(csv_path, report)
+    
+    def iter_transaction_chunks_from_csv(self, csv_filepath, chunk_size=1000):
+        """
+        Import transactions from a CSV file in lists of up to chunk_size rows
+        
+        Args:
+            csv_filepath: Path to CSV file
+            chunk_size: Maximum number of transactions per list
         
+        Returns:
+            Iterator of lists of transaction dictionaries
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        
+        rows = self.iter_transactions_from_csv(csv_filepath)
+        return self._chunked(rows, chunk_size)
+    
+    @staticmethod
+    def _chunked(rows, chunk_size):
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    @staticmethod
+    def _read_csv_rows(csv_path, report):
+        """Generator behind the CSV import methods, invalid rows go to report.reject()"""
         try:
-            with csv_path.open('r') as f:
-                reader = csv.DictReader(f)
+            # utf-8-sig drops the byte order mark Excel puts on exported files
+            with csv_path.open('r', encoding='utf-8-sig', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
                 
-                # Validate headers
-                required_headers = {'date', 'description', 'amount', 'category'}
-                if not required_headers.issubset(reader.fieldnames):
-                    raise ValueError(f"CSV must have headers: {required_headers}")
+                # Look at the first rows once to pick column positions and parsers
+                sample = [(reader.line_num, row) for row in islice(reader, CsvFormat.SAMPLE_ROWS)]
+                convert = CsvFormat.sniff(header, [row for _, row in sample]).build_converter()
                 
-                for row in reader:
-                    # Validate and convert data
+                for line, row in chain(sample, _numbered_rows(reader)):
+                    if not any(row):
+                        continue
                     try:
-                        transaction = {
-                            'date': row['date'].strip(),
-                            'description': row['description'].strip(),
-                            'amount': float(row['amount']),
-                            'category': row['category'].strip()
-                        }
-                        
-                        # Basic validation
-                        if transaction['amount'] <= 0:
-                            raise ValueError("Amount must be positive")
-                        
-                        transactions.append(transaction)
-                    
+                        transaction = convert(row)
                     except ValueError as e:
-                        print(f"Warning: Skipping invalid row: {row} - {e}")
+                        report.reject(line, row, e)
                         continue
-            
-            return transactions
+                    
+                    yield transaction
         
         except Exception as e:
             raise IOError(f"Failed to import CSV: {e}")
     
+    def import_directory(self, directory, workers=None, pattern="*.csv"):
+        """
+        Import every CSV file in a directory, parsing files in parallel
+        
+        Files are parsed in a process pool, one file per task, and the
+        results are merged into a single list sorted by date.
+        
+        Args:
+            directory: Folder containing CSV files
+            workers: Number of worker processes (default: CPU count)
+            pattern: Glob pattern selecting the files to import
+        
+        Returns:
+            Dictionary with the merged 'transactions', total 'accepted' and
+            'rejected' row counts, and a 'files' list of per-file stats
+            (file, accepted, rejected, error_counts, parse_time, error)
+        """
+        dir_path = Path(directory)
+        
+        if not dir_path.is_dir():
+            raise FileNotFoundError(f"Directory not found: {directory}")
+        
+        paths = [str(p) for p in sorted(dir_path.glob(pattern)) if p.is_file()]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if workers <= 1 or len(paths) <= 1:
+            results = [_import_csv_file(p) for p in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+                results = list(pool.map(_import_csv_file, paths))
+        
+        # Each file comes back sorted, so a k-way merge gives date order
+        transactions = list(heapq.merge(*(r.pop('transactions') for r in results),
+                                        key=itemgetter('date')))
+        return {
+            "transactions": transactions,
+            "accepted": sum(r['accepted'] for r in results),
+            "rejected": sum(r['rejected'] for r in results),
+            "files": results
+        }
+    
     def export_transactions_to_csv(self, transactions, csv_filepath):
         """
         Export transactions to CSV file
@@ -200,6 +310,61 @@ class FileHandler:
         except Exception as e:
             raise IOError(f"Failed to export report: {e}")
     
+    def export_monthly_reports_batch(self, usernames, start, end, tax_rate=0.0,
+                                     workers=None, shard_size=500, progress=None):
+        """
+        Export monthly reports for many users, sharding users across processes
+        
+        Each worker loads a profile once, buckets its transactions by
+        (year, month) in a single pass and writes one report per month in
+        the range with export_monthly_report. After-tax income is the
+        profile's income less tax_rate.
+        
+        Args:
+            usernames: Users to report on (e.g. from list_users())
+            start: First (year, month) to report
+            end: Last (year, month) to report, inclusive
+            tax_rate: Tax rate between 0 and 1 applied to each profile's income
+            workers: Number of worker processes (default: CPU count)
+            shard_size: Users handled per worker task
+            progress: Optional callback(users_done, users_total), called after each shard
+        
+        Returns:
+            Dictionary with total 'reports', 'failed' user count, 'elapsed'
+            seconds, and a 'users' list of per-user stats
+            (username, reports, transactions, elapsed, error)
+        """
+        if not 0 <= tax_rate <= 1:
+            raise ValueError("Tax rate must be between 0 and 1")
+        months = _month_range(start, end)
+        usernames = list(usernames)
+        shards = [usernames[i:i + shard_size] for i in range(0, len(usernames), shard_size)]
+        tasks = [(str(self.data_dir), shard, months, tax_rate) for shard in shards]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        began = time.perf_counter()
+        users = []
+        
+        def collect(results):
+            for shard_stats in results:
+                users.extend(shard_stats)
+                if progress is not None:
+                    progress(len(users), len(usernames))
+        
+        if workers <= 1 or len(shards) <= 1:
+            collect(map(_export_user_shard, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+                collect(pool.map(_export_user_shard, tasks))
+        
+        return {
+            "reports": sum(u['reports'] for u in users),
+            "failed": sum(1 for u in users if u['error'] is not None),
+            "elapsed": time.perf_counter() - began,
+            "users": users
+        }
+    
     def list_users(self):
         """
         List all users with saved profiles
@@ -227,3 +392,281 @@ class FileHandler:
             filepath.unlink()
             return True
         return False
+
+
+class InvalidRowError(ValueError):
+    """A CSV row that failed validation, error_type names the kind of failure"""
+    
+    def __init__(self, error_type, message):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+class ImportResult:
+    """
+    Outcome of a CSV import
+    
+    Holds the accepted transactions, per-type counts of rejected rows and,
+    in "collect" mode, the first max_samples rejected rows with their line
+    numbers and reasons. In "strict" mode the first rejected row raises.
+    """
+    
+    MODES = ("strict", "skip", "collect")
+    
+    def __init__(self, mode="collect", max_samples=20):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}")
+        self.mode = mode
+        self.max_samples = max_samples
+        self.transactions = []
+        self.rejected_count = 0
+        self.error_counts = Counter()
+        self.rejected_samples = []
+    
+    @property
+    def accepted_count(self):
+        return len(self.transactions)
+    
+    def reject(self, line, row, error):
+        """Record an invalid row (line is the 1-based line number in the file)"""
+        if self.mode == "strict":
+            raise ValueError(f"Invalid row at line {line}: {error}")
+        error_type = getattr(error, "error_type", "invalid_row")
+        self.rejected_count += 1
+        self.error_counts[error_type] += 1
+        if self.mode == "collect" and len(self.rejected_samples) < self.max_samples:
+            self.rejected_samples.append({
+                "line": line,
+                "row": row,
+                "error_type": error_type,
+                "reason": str(error)
+            })
+    
+    def summary(self):
+        """One-line description of what was imported and skipped"""
+        text = f"Imported {self.accepted_count} rows, skipped {self.rejected_count} invalid rows"
+        if self.error_counts:
+            details = ", ".join(f"{kind}: {count}" for kind, count in self.error_counts.most_common())
+            text += f" ({details})"
+        return text
+
+
+class CsvFormat:
+    """
+    Column layout and value parsers for one CSV file
+    
+    Bank exports differ in header case, column order, date style and how
+    amounts are written ("150.00" vs " $127.43 "). sniff() inspects the
+    header and first rows once, and build_converter() returns a row
+    function with those choices baked in, so no per-row format guessing
+    is needed.
+    """
+    
+    REQUIRED_HEADERS = ('date', 'description', 'amount', 'category')
+    SAMPLE_ROWS = 20
+    DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%y", "%m/%d/%Y", "%Y/%m/%d")
+    
+    def __init__(self, columns, date_format, plain_amounts):
+        self.columns = columns
+        self.date_format = date_format
+        self.plain_amounts = plain_amounts
+    
+    @classmethod
+    def sniff(cls, header, sample_rows):
+        """
+        Choose column positions, date format and amount style
+        
+        Args:
+            header: First row of the file
+            sample_rows: Following rows used to detect formats
+        
+        Returns:
+            CsvFormat for the file
+        """
+        names = [name.strip().lower() for name in header or []]
+        if not set(cls.REQUIRED_HEADERS).issubset(names):
+            raise ValueError(f"CSV must have headers: {set(cls.REQUIRED_HEADERS)}")
+        columns = {field: names.index(field) for field in cls.REQUIRED_HEADERS}
+        
+        dates = [r[columns['date']].strip() for r in sample_rows
+                 if len(r) > columns['date'] and r[columns['date']].strip()]
+        amounts = [r[columns['amount']] for r in sample_rows
+                   if len(r) > columns['amount'] and r[columns['amount']].strip()]
+        
+        # The format most sample dates parse with, so a stray bad date only
+        # rejects its own row; ties go to the earlier format, ISO first
+        date_format = max(cls.DATE_FORMATS,
+                          key=lambda fmt: sum(cls._matches_date_format(d, fmt) for d in dates))
+        
+        plain_amounts = all(cls._is_plain_number(a) for a in amounts)
+        return cls(columns, date_format, plain_amounts)
+    
+    @staticmethod
+    def _matches_date_format(value, fmt):
+        try:
+            datetime.strptime(value, fmt)
+            return True
+        except ValueError:
+            return False
+    
+    @staticmethod
+    def _is_plain_number(value):
+        try:
+            float(value)
+            return True
+        except ValueError:
+            return False
+    
+    def _date_parser(self):
+        """Return a function turning a date cell into YYYY-MM-DD"""
+        fmt = self.date_format
+        # Statements repeat the same handful of dates, so parse each one once
+        cache = {}
+        
+        def parse_date(value):
+            result = cache.get(value)
+            if result is None:
+                text = value.strip()
+                if not text:
+                    raise InvalidRowError("missing_date", "Missing date")
+                try:
+                    if fmt == "%Y-%m-%d":
+                        parsed = date.fromisoformat(text)
+                    else:
+                        parsed = datetime.strptime(text, fmt).date()
+                except ValueError:
+                    raise InvalidRowError("invalid_date", f"Invalid date: {text!r}")
+                result = parsed.isoformat()
+                if len(cache) < 10000:
+                    cache[value] = result
+            return result
+        
+        return parse_date
+    
+    def _amount_parser(self):
+        """Return a function turning an amount cell into a float"""
+        def clean_amount(value):
+            return float(value.replace('$', '').replace(',', '').strip())
+        
+        if not self.plain_amounts:
+            return clean_amount
+        
+        def parse_amount(value):
+            # The sample was plain, but later rows may still be written as "$1,200.00"
+            try:
+                return float(value)
+            except ValueError:
+                return clean_amount(value)
+        
+        return parse_amount
+    
+    def build_converter(self):
+        """
+        Build the row converter for this format
+        
+        Returns:
+            Function mapping a list of cells to a transaction dictionary,
+            raising ValueError for invalid rows
+        """
+        date_col = self.columns['date']
+        description_col = self.columns['description']
+        amount_col = self.columns['amount']
+        category_col = self.columns['category']
+        width = max(self.columns.values()) + 1
+        parse_date = self._date_parser()
+        parse_amount = self._amount_parser()
+        
+        def convert(row):
+            if len(row) < width:
+                raise InvalidRowError("missing_columns", "Row has too few columns")
+            try:
+                amount = parse_amount(row[amount_col])
+            except ValueError:
+                raise InvalidRowError("invalid_amount", f"Invalid amount: {row[amount_col]!r}")
+            if amount <= 0:
+                raise InvalidRowError("non_positive_amount", "Amount must be positive")
+            return {
+                'date': parse_date(row[date_col]),
+                'description': row[description_col].strip(),
+                'amount': amount,
+                'category': row[category_col].strip()
+            }
+        
+        return convert
+
+
+def _import_csv_file(csv_filepath):
+    """Parse one CSV file for FileHandler.import_directory (runs in a worker process)"""
+    report = ImportResult("skip")
+    start = time.perf_counter()
+    try:
+        rows = list(FileHandler._read_csv_rows(Path(csv_filepath), report))
+        error = None
+    except IOError as e:
+        rows = []
+        error = str(e)
+    rows.sort(key=itemgetter('date'))
+    
+    return {
+        "file": Path(csv_filepath).name,
+        "transactions": rows,
+        "accepted": len(rows),
+        "rejected": report.rejected_count,
+        "error_counts": dict(report.error_counts),
+        "parse_time": time.perf_counter() - start,
+        "error": error
+    }
+
+
+def _month_range(start, end):
+    """Every (year, month) from start through end"""
+    first = start[0] * 12 + start[1] - 1
+    last = end[0] * 12 + end[1] - 1
+    if not (1 <= start[1] <= 12 and 1 <= end[1] <= 12) or last < first:
+        raise ValueError(f"Invalid month range: {start} to {end}")
+    return [(i // 12, i % 12 + 1) for i in range(first, last + 1)]
+
+
+def _export_user_shard(task):
+    """Export every month's report for a shard of users (runs in a worker process)"""
+    data_dir, usernames, months, tax_rate = task
+    handler = FileHandler(data_dir)
+    wanted = set(months)
+    stats = []
+    for username in usernames:
+        began = time.perf_counter()
+        reports = 0
+        transactions = 0
+        try:
+            profile = handler.load_user_profile(username)
+            if profile is None:
+                raise IOError(f"No profile for {username}")
+            after_tax_income = profile['income'] * (1 - tax_rate)
+            # One pass over the transactions, bucketed by the YYYY-MM prefix of the date
+            by_month = {month: [] for month in months}
+            for t in profile.get('transactions', []):
+                d = t['date']
+                key = (int(d[:4]), int(d[5:7]))
+                if key in wanted:
+                    by_month[key].append(t)
+                    transactions += 1
+            for (year, month), rows in by_month.items():
+                handler.export_monthly_report(username, month, year, rows, after_tax_income)
+                reports += 1
+            error = None
+        except (IOError, ValueError, KeyError, TypeError) as e:
+            error = str(e)
+        stats.append({
+            "username": username,
+            "reports": reports,
+            "transactions": transactions,
+            "elapsed": time.perf_counter() - began,
+            "error": error
+        })
+    return stats
+
+
+def _numbered_rows(reader):
+    """Pair each csv.reader row with the line number it ended on"""
+    for row in reader:
+        yield reader.line_num, row
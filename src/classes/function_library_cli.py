@@ -0,0 +1,62 @@
+#Interactive BudgetBuddy session built on Function_Library.
+#Run from the src/classes folder: python function_library_cli.py
+from Function_Library import (
+    username_creation,
+    is_username_taken_from_file,
+    log_monthly_budget,
+    spending_categories,
+    calculate_money_available_after_tax,
+    track_monthly_spending,
+    get_most_frequent_transaction_category,
+)
+
+
+def main():
+    username_creation()
+
+    new_username = input("Enter a desired username: ")
+    if is_username_taken_from_file(new_username):
+        print("This username is already taken. Please choose another.")
+    else:
+        print("Username is available!")
+        # Optionally, add the new username to the file
+        with open("users.txt", "a") as f:
+            f.write(new_username + "\n")
+
+    #User input monthly income and spending
+    income = float(input("Please enter your income for this month: "))
+    spending = float(input("Please enter your spending for this month: "))
+    log_monthly_budget(income, spending)
+
+    #Categorize spendings into different groups (Ex. Food, Rent, entertainment)
+    print("\nEnter your spending for the following categories:")
+    spending_by_category = {}
+    for category in spending_categories:
+        amount = float(input(f"How much did you spend on {category}? $"))
+        spending_by_category[category] = amount
+    total_category_spending = sum(spending_by_category.values())
+    print(f"\n You have spent a total of ${total_category_spending:.2f} this month.")
+
+    #Get user input for salary and tax rate
+    salary = float(input("Enter your salary: "))
+    tax_rate = float(input("Enter your tax rate (0-1): "))
+    available = calculate_money_available_after_tax(salary, tax_rate)
+    print(f"Money available after tax: ${available:,.2f}")
+
+    #gets user input for spending information (Categorization #3)
+    amount = float(input("Enter amount spent: "))
+    category = input("Enter spending category: ")
+    description = input("Enter a short description: ")
+    month = input("Enter the month: ")
+    track_monthly_spending(amount, category, description, month)
+    print("Spending record added")
+
+    most_frequent = get_most_frequent_transaction_category()
+    if most_frequent:
+        print(f"Most frequent transaction category: {most_frequent}")
+    else:
+        print("No transactions found.")
+
+
+if __name__ == "__main__":
+    main()
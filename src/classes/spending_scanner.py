@@ -0,0 +1,99 @@
+import mmap
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Files smaller than this are scanned in the calling process
+INLINE_SCAN_BYTES = 16 * 1024 * 1024
+DEFAULT_CHUNK_BYTES = 32 * 1024 * 1024
+
+
+class SpendingScan:
+    """Aggregates from one pass over a spending file.
+
+    category_counts counts every line with at least three fields, as
+    Transaction.get_most_frequent_category does. monthly_totals sums the
+    amounts of full four-field lines, the ones get_all_transactions returns.
+    Both are in first-seen order. Amounts are summed per chunk, so a total
+    can differ from a sequential sum in its last bits.
+    """
+
+    def __init__(self):
+        self.category_counts = Counter()
+        self.monthly_totals = {}
+        self.record_count = 0
+
+    def merge(self, counts, totals, records):
+        for category, count in counts.items():
+            self.category_counts[category.decode("utf-8", errors="replace")] += count
+        for month, amount in totals.items():
+            month = month.decode("utf-8", errors="replace")
+            self.monthly_totals[month] = self.monthly_totals.get(month, 0) + amount
+        self.record_count += records
+
+    def most_frequent_category(self):
+        """Same answer as Transaction.get_most_frequent_category, ties going to the first category seen."""
+        most_common = self.category_counts.most_common(1)
+        return most_common[0][0] if most_common else None
+
+
+def scan_spending_file(filename="monthly_spending.txt", workers=None, chunk_size=DEFAULT_CHUNK_BYTES):
+    """Counts categories and sums amounts per month across a spending file.
+
+    The file is memory-mapped and split into newline-aligned chunks that are
+    scanned in a process pool. Chunk results are merged in file order, so the
+    answers match a sequential read. Small files are scanned inline.
+
+    Returns a SpendingScan, or None if the file does not exist.
+    """
+    try:
+        size = os.path.getsize(filename)
+    except FileNotFoundError:
+        return None
+    scan = SpendingScan()
+    if size == 0:
+        return scan
+
+    ranges = _chunk_ranges(filename, size, chunk_size)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(ranges) == 1 or size < INLINE_SCAN_BYTES:
+        results = [_scan_range(filename, start, end) for start, end in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+            results = pool.map(_scan_range, [filename] * len(ranges),
+                               [start for start, _ in ranges], [end for _, end in ranges])
+    for counts, totals, records in results:
+        scan.merge(counts, totals, records)
+    return scan
+
+
+def _chunk_ranges(filename, size, chunk_size):
+    """Splits the file into (start, end) byte ranges that each end just after a newline (or at EOF)."""
+    ranges = []
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = mm.find(b"\n", min(start + chunk_size, size) - 1)
+            end = size if end == -1 else end + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _scan_range(filename, start, end):
+    """Scans one chunk of a spending file (runs in a worker process); keys stay as bytes until the merge."""
+    counts = Counter()
+    totals = {}
+    records = 0
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+    for line in data.split(b"\n"):
+        parts = line.strip().split(b",", 3)
+        if len(parts) < 3:
+            continue
+        counts[parts[2]] += 1
+        if len(parts) == 4:
+            month = parts[0]
+            totals[month] = totals.get(month, 0) + float(parts[1])
+            records += 1
+    return counts, totals, records
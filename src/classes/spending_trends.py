@@ -0,0 +1,105 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # the matrix is built with plain Python loops instead
+    np = None
+
+ROLLING_WINDOWS = (3, 6, 12)
+
+
+def build_spending_matrix(transactions):
+    """Sums spending into a (month x category) matrix in one pass over transactions.
+
+    Transactions are dicts or objects with date, amount and category; dates
+    are date objects or YYYY-MM-DD strings. Months run without gaps from the
+    earliest to the latest month seen, so empty months are zero rows.
+
+    Returns (months, categories, rows) where months are (year, month) pairs,
+    categories are in first-seen order and rows[i][j] is the total spent in
+    categories[j] during months[i].
+    """
+    category_codes = {}
+    month_keys = array('i')
+    codes = array('I')
+    amounts = array('d')
+    for t in transactions:
+        if isinstance(t, dict):
+            day, amount, category = t['date'], t['amount'], t['category']
+        else:
+            day, amount, category = t.date, t.amount, t.category
+        if isinstance(day, str):
+            month_keys.append(int(day[:4]) * 12 + int(day[5:7]) - 1)
+        else:
+            month_keys.append(day.year * 12 + day.month - 1)
+        code = category_codes.get(category)
+        if code is None:
+            code = category_codes[category] = len(category_codes)
+        codes.append(code)
+        amounts.append(amount)
+
+    categories = list(category_codes)
+    if not amounts:
+        return [], categories, []
+    first = min(month_keys)
+    month_count = max(month_keys) - first + 1
+    months = [((first + i) // 12, (first + i) % 12 + 1) for i in range(month_count)]
+    width = len(categories)
+
+    if np is not None:
+        cells = (np.frombuffer(month_keys, dtype=np.int32) - first) * width + np.frombuffer(codes, dtype=np.uint32)
+        sums = np.bincount(cells, weights=np.frombuffer(amounts, dtype=np.float64), minlength=month_count * width)
+        return months, categories, sums.reshape(month_count, width).tolist()
+
+    rows = [[0.0] * width for _ in range(month_count)]
+    for key, code, amount in zip(month_keys, codes, amounts):
+        rows[key - first][code] += amount
+    return months, categories, rows
+
+
+def spending_trends(transactions, windows=ROLLING_WINDOWS):
+    """Per-category monthly trends, derived from build_spending_matrix.
+
+    Returns {category: stats}. Every series in stats is aligned with
+    stats['months'] (YYYY-MM strings):
+
+    - monthly: total spent each month
+    - change: month-over-month difference (None for the first month)
+    - growth: change as a fraction of the previous month (None if that was 0)
+    - rolling_<w>: trailing w-month average (None until w months are available)
+
+    plus total and the last month's change and growth.
+    Costs O(n + months x categories).
+    """
+    months, categories, rows = build_spending_matrix(transactions)
+    labels = [f"{year}-{month:02d}" for year, month in months]
+    trends = {}
+    for j, category in enumerate(categories):
+        monthly = [row[j] for row in rows]
+        change = [None] + [cur - prev for prev, cur in zip(monthly, monthly[1:])]
+        growth = [None] + [(cur - prev) / prev if prev else None for prev, cur in zip(monthly, monthly[1:])]
+        stats = {
+            "months": labels,
+            "monthly": monthly,
+            "change": change,
+            "growth": growth,
+        }
+        for w in windows:
+            stats[f"rolling_{w}"] = _rolling_average(monthly, w)
+        stats["total"] = sum(monthly)
+        stats["latest_change"] = change[-1]
+        stats["latest_growth"] = growth[-1]
+        trends[category] = stats
+    return trends
+
+
+def _rolling_average(values, window):
+    """Trailing averages using a running window sum."""
+    averages = []
+    running = 0.0
+    for i, value in enumerate(values):
+        running += value
+        if i >= window:
+            running -= values[i - window]
+        averages.append(running / window if i >= window - 1 else None)
+    return averages
@@ -1,27 +1,395 @@
 import json
 import os
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from datetime import datetime, date as date_type
 from collections import defaultdict
+from contextlib import contextmanager
+from classes.AnomalyDetector import AnomalyDetector, stats_filename
+
+class FenwickTree:
+    """Binary indexed tree: point updates and prefix sums in O(log n)"""
+    
+    def __init__(self, values):
+        # Built in O(n) by pushing each node into its parent
+        self._tree = [0] + list(values)
+        size = len(self._tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                self._tree[parent] += self._tree[i]
+    
+    def __len__(self):
+        return len(self._tree) - 1
+    
+    def add(self, pos, delta):
+        tree = self._tree
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+    
+    def prefix_sum(self, pos):
+        """Sum of positions 0..pos inclusive"""
+        tree = self._tree
+        total = 0
+        i = pos + 1
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+class DateRangeTotals:
+    """Running per-day totals that sum any date window, overall or for one category
+    
+    Trees are indexed by the distinct days seen, not by every day in the
+    span, so one far-off date (a typo year) costs one slot, not millions.
+    """
+    
+    def __init__(self):
+        # Sorted distinct day ordinals that have a tree slot, and their positions
+        self._days = []
+        self._positions = {}
+        # Sorted days older than the newest slotted day, waiting for the next rebuild
+        self._pending = []
+        # category -> {day ordinal: amount}, kept so trees can be rebuilt
+        self._daily = {}
+        # category -> FenwickTree over day positions; None holds the all-category total
+        self._trees = {}
+    
+    @staticmethod
+    def _ordinal(day):
+        if isinstance(day, str):
+            day = date_type.fromisoformat(day)
+        return day.toordinal()
+    
+    def add(self, day, amount, category=None):
+        """Record `amount` on `day` (a date or YYYY-MM-DD string)"""
+        ordinal = self._ordinal(day)
+        pos = self._positions.get(ordinal)
+        if pos is None:
+            if not self._days or ordinal > self._days[-1]:
+                pos = self._positions[ordinal] = len(self._days)
+                self._days.append(ordinal)
+            else:
+                # Slotting an earlier day shifts every position after it, so
+                # batch such days and rebuild once there are enough of them
+                i = bisect_left(self._pending, ordinal)
+                if i == len(self._pending) or self._pending[i] != ordinal:
+                    self._pending.insert(i, ordinal)
+        
+        keys = (None,) if category is None else (None, category)
+        for key in keys:
+            daily = self._daily.setdefault(key, defaultdict(float))
+            if pos is not None:
+                tree = self._trees.get(key)
+                if tree is None or pos >= len(tree):
+                    tree = self._trees[key] = self._build_tree(daily)
+                tree.add(pos, amount)
+            daily[ordinal] += amount
+        
+        # Rebuilding after a fixed fraction of new days keeps it amortized O(1) per day
+        if len(self._pending) > max(64, len(self._days) // 8):
+            self._merge_pending()
+    
+    def _build_tree(self, daily):
+        """Tree with spare slots for later days, doubling so growth stays amortized O(1)"""
+        values = [0] * max(32, 2 * len(self._days))
+        positions = self._positions
+        for day, amount in daily.items():
+            pos = positions.get(day)
+            if pos is not None:
+                values[pos] += amount
+        return FenwickTree(values)
+    
+    def _merge_pending(self):
+        """Give pending days their slots and rebuild every tree"""
+        self._days = sorted(self._days + self._pending)
+        self._positions = {day: pos for pos, day in enumerate(self._days)}
+        self._pending = []
+        self._trees = {key: self._build_tree(daily) for key, daily in self._daily.items()}
+    
+    def total(self, start, end, category=None):
+        """Sum of amounts from `start` through `end` inclusive"""
+        daily = self._daily.get(category)
+        if daily is None:
+            return 0
+        first, last = self._ordinal(start), self._ordinal(end)
+        pending = self._pending
+        total = sum(daily.get(day, 0) for day in
+                    pending[bisect_left(pending, first):bisect_right(pending, last)])
+        tree = self._trees.get(category)
+        if tree is not None:
+            lo = bisect_left(self._days, first)
+            hi = min(bisect_right(self._days, last), len(tree)) - 1
+            if lo <= hi:
+                total += tree.prefix_sum(hi) - tree.prefix_sum(lo - 1)
+        return total
+    
+    def totals_by_category(self, start, end):
+        """Per-category sums over `start` through `end` inclusive, zero totals left out"""
+        totals = {}
+        for category in self._daily:
+            if category is None:
+                continue
+            amount = self.total(start, end, category)
+            if amount:
+                totals[category] = amount
+        return totals
+
 
 class FinanceTracker:
-    def __init__(self, filename='finance_data.json'):
+    # Field each kind of entry is grouped by in range totals
+    GROUP_FIELDS = {'income': 'source', 'expenses': 'category'}
+    
+    def __init__(self, filename='finance_data.json', journal=False, compact_threshold=1000,
+                 detect_anomalies=False):
         self.filename = filename
+        # In journal mode new entries are appended to a log next to the JSON
+        # snapshot instead of rewriting the whole file on every add
+        self.journal = journal
+        self.compact_threshold = compact_threshold
+        self._journal_entries = 0
+        # Entries added inside `with tracker.batch():`, None when not batching
+        self._batch = None
+        self._batch_needs_snapshot = False
         self.data = self.load_data()
+        # Per-category expense statistics, saved next to the snapshot
+        self.anomaly_detector = self._load_anomaly_detector() if detect_anomalies else None
+    
+    def _load_anomaly_detector(self):
+        """Load saved expense statistics and fold in only the expenses added after them"""
+        detector = AnomalyDetector.load(stats_filename(self.filename))
+        detector.catch_up(self.data['expenses'])
+        return detector
+    
+    def _commit_expense_stats(self, entries):
+        """Fold committed (kind, entry) pairs into the anomaly statistics"""
+        if self.anomaly_detector is not None:
+            for kind, entry in entries:
+                if kind == 'expenses':
+                    self.anomaly_detector.update(entry['category'], entry['amount'])
+    
+    @property
+    def journal_filename(self):
+        """Append-only log of entries added since the last snapshot"""
+        return os.path.splitext(self.filename)[0] + '.journal'
+    
+    def _finish_snapshot_swap(self):
+        """Complete a _write_snapshot that was interrupted after moving the journal aside"""
+        folded_filename = self.journal_filename + '.folded'
+        if not os.path.exists(folded_filename):
+            return
+        # The temp snapshot was complete before the journal was moved, so it
+        # already holds the folded entries; if it is gone it was swapped in
+        tmp_filename = self.filename + '.tmp'
+        if os.path.exists(tmp_filename):
+            os.replace(tmp_filename, self.filename)
+        os.remove(folded_filename)
     
     def load_data(self):
+        self._finish_snapshot_swap()
         try:
             with open(self.filename, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
         except FileNotFoundError:
-            return {
+            data = {
                 'income': [],
                 'expenses': [],
                 'budget_categories': {}
             }
+        self._journal_entries = self._replay_journal(data)
+        self._build_indexes(data)
+        return data
+    
+    @staticmethod
+    def _parse_date(date):
+        """Parse a YYYY-MM-DD date string"""
+        try:
+            return date_type.fromisoformat(date)
+        except (TypeError, ValueError):
+            return datetime.strptime(date, '%Y-%m-%d').date()
+    
+    def _build_indexes(self, data):
+        """Build the (year, month) position index and the date-range totals"""
+        # (year, month) -> record positions, so monthly queries skip other months
+        self._month_index = {'income': defaultdict(list), 'expenses': defaultdict(list)}
+        self._range_totals = {'income': DateRangeTotals(), 'expenses': DateRangeTotals()}
+        for kind in self._month_index:
+            for pos, entry in enumerate(data[kind]):
+                try:
+                    day = self._parse_date(entry['date'])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                self._index_entry(kind, pos, entry, day)
+    
+    def _index_entry(self, kind, pos, entry, day):
+        self._month_index[kind][(day.year, day.month)].append(pos)
+        self._range_totals[kind].add(day, entry['amount'], entry[self.GROUP_FIELDS[kind]])
+    
+    def _replay_journal(self, data):
+        """Apply journaled entries on top of the snapshot, returns how many were applied"""
+        applied = 0
+        good_offset = 0
+        torn = False
+        try:
+            with open(self.journal_filename, 'rb') as f:
+                for line in f:
+                    # A crash mid-append can leave a partial last line behind
+                    try:
+                        if not line.endswith(b'\n'):
+                            raise ValueError("incomplete journal record")
+                        kind, entry = json.loads(line)
+                    except ValueError:
+                        torn = True
+                        break
+                    data[kind].append(entry)
+                    applied += 1
+                    good_offset += len(line)
+        except FileNotFoundError:
+            return 0
+        
+        if torn:
+            # Cut the damaged tail so later appends start on a clean line
+            with open(self.journal_filename, 'r+b') as f:
+                f.truncate(good_offset)
+        return applied
     
     def save_data(self):
-        with open(self.filename, 'w') as f:
+        if self._batch is not None:
+            # Deferred until the batch exits
+            self._batch_needs_snapshot = True
+            return
+        self._write_snapshot()
+    
+    def _write_snapshot(self):
+        # Write to a temp file first so a crash never leaves a half-written snapshot
+        tmp_filename = self.filename + '.tmp'
+        with open(tmp_filename, 'w') as f:
             json.dump(self.data, f, indent=2)
+        
+        # Move the journal aside before the swap so a crash in between never
+        # leaves the new snapshot next to a journal it already contains;
+        # load_data finishes whichever step was cut short
+        folded_filename = self.journal_filename + '.folded'
+        try:
+            os.replace(self.journal_filename, folded_filename)
+        except FileNotFoundError:
+            folded_filename = None
+        os.replace(tmp_filename, self.filename)
+        if self.anomaly_detector is not None:
+            self.anomaly_detector.save(stats_filename(self.filename))
+        
+        # The snapshot now holds everything, so the old journal can go
+        if folded_filename is not None:
+            os.remove(folded_filename)
+        self._journal_entries = 0
+    
+    def compact(self):
+        """Fold the journal into the JSON snapshot"""
+        self.save_data()
+    
+    @contextmanager
+    def batch(self):
+        """Defer saving until the block exits; if anything fails, no entry from the block is kept"""
+        if self._batch is not None:
+            # Nested batches join the outer one
+            yield self
+            return
+        
+        self._batch = []
+        self._batch_needs_snapshot = False
+        budget_categories = dict(self.data['budget_categories'])
+        try:
+            yield self
+        except BaseException:
+            pending, self._batch = self._batch, None
+            for kind, entry, day in reversed(pending):
+                self._remove_last_entry(kind, entry, day)
+            self.data['budget_categories'] = budget_categories
+            raise
+        
+        pending, self._batch = self._batch, None
+        entries = [(kind, entry) for kind, entry, day in pending]
+        self._commit_expense_stats(entries)
+        if self._batch_needs_snapshot:
+            self._write_snapshot()
+        elif entries:
+            self._persist(entries)
+    
+    @staticmethod
+    def _validate_amount(amount):
+        if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+            raise ValueError(f"Amount must be a number, got {amount!r}")
+        return amount
+    
+    def _income_entry(self, amount, source, date=None):
+        if date is None:
+            date = datetime.now().strftime('%Y-%m-%d')
+        return {
+            'amount': self._validate_amount(amount),
+            'source': source,
+            'date': date
+        }
+    
+    def _expense_entry(self, amount, category, description, date=None):
+        if date is None:
+            date = datetime.now().strftime('%Y-%m-%d')
+        return {
+            'amount': self._validate_amount(amount),
+            'category': category,
+            'description': description,
+            'date': date
+        }
+    
+    def _add_entry(self, kind, entry):
+        """
+        Store a new entry, keep the indexes current and persist it
+        
+        Returns the AnomalyScore for expenses when anomaly detection is on.
+        Inside a batch, expenses are scored against the statistics from
+        before the batch and counted once it commits.
+        """
+        day = self._parse_date(entry['date'])
+        score = None
+        if kind == 'expenses' and self.anomaly_detector is not None:
+            score = self.anomaly_detector.score(entry['category'], entry['amount'])
+        records = self.data[kind]
+        self._index_entry(kind, len(records), entry, day)
+        records.append(entry)
+        if self._batch is not None:
+            self._batch.append((kind, entry, day))
+        else:
+            self._commit_expense_stats([(kind, entry)])
+            self._persist([(kind, entry)])
+        return score
+    
+    def _remove_last_entry(self, kind, entry, day):
+        """Undo the most recent _add_entry for `kind`"""
+        self.data[kind].pop()
+        key = (day.year, day.month)
+        positions = self._month_index[kind][key]
+        positions.pop()
+        if not positions:
+            del self._month_index[kind][key]
+        self._range_totals[kind].add(day, -entry['amount'], entry[self.GROUP_FIELDS[kind]])
+    
+    def _persist(self, entries):
+        """Write newly added (kind, entry) pairs to disk"""
+        if not self.journal:
+            self._write_snapshot()
+            return
+        
+        with open(self.journal_filename, 'a') as f:
+            f.write(''.join(json.dumps([kind, entry], separators=(',', ':')) + '\n'
+                            for kind, entry in entries))
+        self._journal_entries += len(entries)
+        
+        # Compact once the journal is as large as the snapshot, so the cost of
+        # rewriting the snapshot is spread evenly over the appends before it
+        snapshot_entries = len(self.data['income']) + len(self.data['expenses']) - self._journal_entries
+        if self._journal_entries >= max(self.compact_threshold, snapshot_entries):
+            self.compact()
     
     def set_data_folder(self):
         """Allow user to specify a custom folder name for saving data"""
@@ -123,35 +491,70 @@ class FinanceTracker:
                 'expenses': [],
                 'budget_categories': {}
             }
+            self._build_indexes(self.data)
+            if self.anomaly_detector is not None:
+                self.anomaly_detector.reset()
             self.save_data()
             print("\n✓ All data has been cleared. Starting fresh!")
         else:
             print("\n✓ Deletion cancelled. Your data is safe.")
     
     def add_income(self, amount, source, date=None):
-        if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
-        
-        self.data['income'].append({
-            'amount': amount,
-            'source': source,
-            'date': date
-        })
-        self.save_data()
+        self._add_entry('income', self._income_entry(amount, source, date))
         print(f"✓ Income added: ${amount} from {source}")
     
     def add_expense(self, amount, category, description, date=None):
-        if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
-        
-        self.data['expenses'].append({
-            'amount': amount,
-            'category': category,
-            'description': description,
-            'date': date
-        })
-        self.save_data()
+        score = self._add_entry('expenses', self._expense_entry(amount, category, description, date))
         print(f"✓ Expense added: ${amount} for {description} ({category})")
+        if score is not None and score.is_anomaly:
+            print(f"⚠️  Unusual expense: ${amount} is well above your typical {category} spending "
+                  f"(about ${score.quantile_value:,.2f} or less)")
+        return score
+    
+    def add_incomes_bulk(self, records):
+        """
+        Add many income records with a single save
+        
+        Each record is a dict with 'amount', 'source' and optionally 'date'.
+        If any record is invalid, none of them are added.
+        """
+        with self.batch():
+            count = 0
+            for record in records:
+                try:
+                    entry = self._income_entry(record['amount'], record['source'], record.get('date'))
+                except KeyError as e:
+                    raise ValueError(f"Income record missing field {e}: {record}")
+                self._add_entry('income', entry)
+                count += 1
+        print(f"✓ {count} income entries added")
+        return count
+    
+    def add_expenses_bulk(self, records):
+        """
+        Add many expense records with a single save
+        
+        Each record is a dict with 'amount', 'category', 'description' and
+        optionally 'date', e.g. the output of FileHandler.import_transactions_from_csv.
+        If any record is invalid, none of them are added.
+        """
+        with self.batch():
+            count = 0
+            unusual = 0
+            for record in records:
+                try:
+                    entry = self._expense_entry(record['amount'], record['category'],
+                                                record['description'], record.get('date'))
+                except KeyError as e:
+                    raise ValueError(f"Expense record missing field {e}: {record}")
+                score = self._add_entry('expenses', entry)
+                count += 1
+                if score is not None and score.is_anomaly:
+                    unusual += 1
+        print(f"✓ {count} expenses added")
+        if unusual:
+            print(f"⚠️  {unusual} of them look unusual for their category")
+        return count
     
     def get_monthly_income(self, month=None, year=None):
         if month is None or year is None:
@@ -160,10 +563,9 @@ class FinanceTracker:
             year = now.year
         
         total = 0
-        for income in self.data['income']:
-            date = datetime.strptime(income['date'], '%Y-%m-%d')
-            if date.month == month and date.year == year:
-                total += income['amount']
+        incomes = self.data['income']
+        for pos in self._month_index['income'].get((year, month), ()):
+            total += incomes[pos]['amount']
         
         return total
     
@@ -176,14 +578,26 @@ class FinanceTracker:
         total = 0
         category_breakdown = defaultdict(float)
         
-        for expense in self.data['expenses']:
-            date = datetime.strptime(expense['date'], '%Y-%m-%d')
-            if date.month == month and date.year == year:
-                total += expense['amount']
-                category_breakdown[expense['category']] += expense['amount']
+        expenses = self.data['expenses']
+        for pos in self._month_index['expenses'].get((year, month), ()):
+            expense = expenses[pos]
+            total += expense['amount']
+            category_breakdown[expense['category']] += expense['amount']
         
         return total, dict(category_breakdown)
     
+    def get_income_total(self, start, end, source=None):
+        """Income received from `start` through `end` inclusive, optionally from one source"""
+        return self._range_totals['income'].total(start, end, source)
+    
+    def get_expense_total(self, start, end, category=None):
+        """Money spent from `start` through `end` inclusive, optionally in one category"""
+        return self._range_totals['expenses'].total(start, end, category)
+    
+    def get_expense_breakdown(self, start, end):
+        """Spending per category from `start` through `end` inclusive"""
+        return self._range_totals['expenses'].totals_by_category(start, end)
+    
     def suggest_budget(self):
         income = self.get_monthly_income()
         
@@ -0,0 +1,118 @@
+import unittest
+import sys
+import os
+import random
+import tempfile
+import shutil
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'classes'))
+from AnomalyDetector import AnomalyDetector, P2Quantile, stats_filename
+from Expense import Expense
+from ExpenseTracker import ExpenseTracker
+
+
+class TestStreamingStatistics(unittest.TestCase):
+    """Tests for the Welford and P-square building blocks"""
+    
+    def test_quantile_sketch_tracks_exact_quantile(self):
+        """Test the P-square estimate lands near the true 95th percentile"""
+        rng = random.Random(3)
+        values = [rng.lognormvariate(3, 0.6) for _ in range(20000)]
+        sketch = P2Quantile(0.95)
+        for v in values:
+            sketch.add(v)
+        exact = sorted(values)[int(0.95 * len(values))]
+        self.assertLess(abs(sketch.value() - exact) / exact, 0.03)
+    
+    def test_mean_and_std_match_batch(self):
+        """Test running mean and standard deviation"""
+        detector = AnomalyDetector()
+        amounts = [12.0, 15.5, 9.25, 30.0, 14.0]
+        detector.backfill(("Food", a) for a in amounts)
+        stats = detector.stats("Food")
+        mean = sum(amounts) / len(amounts)
+        self.assertAlmostEqual(stats.mean, mean)
+        self.assertAlmostEqual(stats.std, (sum((a - mean) ** 2 for a in amounts) / 4) ** 0.5)
+        self.assertEqual(detector.seen, 5)
+
+
+class TestAnomalyDetector(unittest.TestCase):
+    """Tests for scoring, persistence and tracker hooks"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        rng = random.Random(11)
+        self.history = [("Food", round(rng.uniform(20, 60), 2)) for _ in range(200)]
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_scores_new_expenses(self):
+        """Test that only large outliers in an established category are flagged"""
+        detector = AnomalyDetector()
+        detector.backfill(self.history)
+        self.assertTrue(detector.observe("Food", 400).is_anomaly)
+        self.assertFalse(detector.observe("Food", 45).is_anomaly)
+        self.assertFalse(detector.observe("Travel", 5000).is_anomaly)
+        self.assertEqual(detector.seen, 203)
+    
+    def test_state_round_trips_and_catches_up(self):
+        """Test saved state only needs the records after `seen`"""
+        path = os.path.join(self.test_dir, "stats.json")
+        detector = AnomalyDetector(min_samples=5)
+        detector.backfill(self.history[:150])
+        detector.save(path)
+        
+        restored = AnomalyDetector.load(path)
+        restored.catch_up(self.history)
+        full = AnomalyDetector(min_samples=5)
+        full.backfill(self.history)
+        self.assertEqual(restored.to_dict(), full.to_dict())
+        
+        restored.catch_up(self.history[:10])  # history replaced by a shorter one
+        self.assertEqual(restored.seen, 10)
+        self.assertEqual(AnomalyDetector.load(os.path.join(self.test_dir, "missing.json")).seen, 0)
+    
+    def test_expense_tracker_hook(self):
+        """Test ExpenseTracker scores on add and resumes from saved stats"""
+        filename = os.path.join(self.test_dir, "monthly_spending.txt")
+        tracker = ExpenseTracker(anomaly_detector=AnomalyDetector())
+        for category, amount in self.history:
+            tracker.add_expense(Expense(amount, category, "meal", "2024-01-01"))
+        tracker.save_to_file(filename)
+        self.assertTrue(os.path.exists(stats_filename(filename)))
+        
+        loaded = ExpenseTracker.load_from_file(filename, detect_anomalies=True)
+        self.assertEqual(loaded.anomaly_detector.seen, 200)
+        self.assertTrue(loaded.add_expense(Expense(500, "Food", "banquet", "2024-01-02")).is_anomaly)
+        self.assertIsNone(ExpenseTracker().add_expense(Expense(5, "Food", "snack", "2024-01-02")))
+
+    def test_fresh_tracker_appending_keeps_stats_aligned(self):
+        """Test stats from a tracker that did not load the file are not saved over the file's own"""
+        filename = os.path.join(self.test_dir, "monthly_spending.txt")
+        tracker = ExpenseTracker(anomaly_detector=AnomalyDetector())
+        for category, amount in self.history[:20]:
+            tracker.add_expense(Expense(amount, category, "meal", "2024-01-01"))
+        tracker.save_to_file(filename)
+
+        appender = ExpenseTracker(anomaly_detector=AnomalyDetector())
+        for amount in (900, 950, 1000):
+            appender.add_expense(Expense(amount, "Rent", "monthly", "2024-02-01"))
+        appender.save_to_file(filename)
+        appender.save_to_file(filename)
+        # The first tracker saves again after the appender's rows landed in the file
+        tracker.add_expense(Expense(35, "Food", "meal", "2024-02-02"))
+        tracker.save_to_file(filename)
+
+        for stats_on_disk in (True, False):
+            if not stats_on_disk:
+                os.remove(stats_filename(filename))
+            detector = ExpenseTracker.load_from_file(filename, detect_anomalies=True).anomaly_detector
+            self.assertEqual((detector.stats("Food").count, detector.stats("Rent").count), (21, 3))
+            self.assertEqual(detector.seen, 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'classes'))
+from BudgetAnalyzer import BudgetAnalyzer
+from Expense import Expense
+from ExpenseTracker import ExpenseTracker
+from User import User
+
+
+class CountingFinance:
+    """Finance stand-in that records how often after-tax income is computed"""
+    
+    def __init__(self, salary):
+        self.salary = salary
+        self.tax_rate = 0.2
+        self.calls = 0
+    
+    def calculate_after_tax_income(self):
+        self.calls += 1
+        return self.salary * (1 - self.tax_rate)
+
+
+class VersionedFinance(CountingFinance):
+    """CountingFinance whose version changes with its salary"""
+    
+    def __init__(self, salary):
+        super().__init__(salary)
+        self.version = 0
+    
+    def set_salary(self, salary):
+        self.salary = salary
+        self.version += 1
+
+
+class CountingTracker(ExpenseTracker):
+    """ExpenseTracker that records how often its aggregates are read"""
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+    
+    def get_total_spending(self):
+        self.calls += 1
+        return super().get_total_spending()
+
+
+class TestBudgetAnalyzerSnapshot(unittest.TestCase):
+    """Tests for the versioned analysis snapshot"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.user = User("alice", storage_path=os.path.join(self.test_dir, "users.txt"))
+        self.tracker = CountingTracker()
+        self.tracker.add_expense(Expense(300, "Food", "groceries", "2024-01-02"))
+        self.finance = VersionedFinance(5000)
+        self.analyzer = BudgetAnalyzer(self.user, self.tracker, self.finance)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_report_computes_each_aggregate_once(self):
+        """Test a report reads each aggregate once and repeats are free"""
+        report = self.analyzer.generate_report()
+        self.assertIn("Remaining Balance: $3,700.00", report)
+        self.assertIn("Most Frequent Category: Food", report)
+        self.assertEqual((self.finance.calls, self.tracker.calls), (1, 1))
+        
+        self.assertIs(self.analyzer.generate_report(), report)
+        self.assertEqual(self.analyzer.calculate_budget_balance(), 3700)
+        self.assertEqual((self.finance.calls, self.tracker.calls), (1, 1))
+    
+    def test_changes_invalidate_snapshot(self):
+        """Test new expenses and salary changes are picked up"""
+        self.analyzer.generate_report()
+        self.tracker.add_expense(Expense(200, "Rent", "deposit", "2024-01-03"))
+        self.assertIn("Remaining Balance: $3,500.00", self.analyzer.generate_report())
+        self.finance.set_salary(6000)
+        self.assertIn("Remaining Balance: $4,300.00", self.analyzer.generate_report())
+        self.assertEqual(self.finance.calls, 2)
+        self.assertEqual(self.tracker.version, 2)
+    
+    def test_unversioned_finance_is_recomputed_per_report(self):
+        """Test a tax change on a finance without a version shows up in the next report"""
+        finance = CountingFinance(5000)
+        analyzer = BudgetAnalyzer(self.user, self.tracker, finance)
+        self.assertIn("Remaining Balance: $3,700.00", analyzer.generate_report())
+        finance.tax_rate = 0.3
+        self.assertIn("Remaining Balance: $3,200.00", analyzer.generate_report())
+        self.assertEqual((finance.calls, self.tracker.calls), (2, 1))
+
+if __name__ == '__main__':
+    unittest.main()
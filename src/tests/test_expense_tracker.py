@@ -0,0 +1,255 @@
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+import random
+import time
+from datetime import date
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'classes'))
+from Expense import Expense
+from ExpenseTracker import ExpenseTracker
+from ColumnarExpenseTracker import ColumnarExpenseTracker
+
+
+class TestExpenseTrackerAggregates(unittest.TestCase):
+    """Tests for the running totals kept by ExpenseTracker"""
+    
+    def setUp(self):
+        """Set up a tracker with a few expenses"""
+        self.tracker = ExpenseTracker()
+        for amount, category, date in [
+            (1200, "Housing", "2024-01-01"),
+            (80.5, "Food", "2024-01-03"),
+            (40, "Transport", "2024-01-04"),
+            (25.25, "Food", "2024-01-05"),
+            (15, "Transport", "2024-01-06"),
+            (9.99, "Food", "2024-01-07"),
+        ]:
+            self.tracker.add_expense(Expense(amount, category, "item", date))
+    
+    def test_total_spending(self):
+        """Test running total matches a fresh sum"""
+        self.assertEqual(self.tracker.get_total_spending(), 1200 + 80.5 + 40 + 25.25 + 15 + 9.99)
+    
+    def test_most_frequent_category(self):
+        """Test most frequent category and first-seen tie breaking"""
+        self.assertEqual(self.tracker.get_most_frequent_category(), "Food")
+        tied = ExpenseTracker()
+        tied.add_expense(Expense(5, "Transport", "bus", "2024-01-01"))
+        tied.add_expense(Expense(5, "Food", "snack", "2024-01-01"))
+        self.assertEqual(tied.get_most_frequent_category(), "Transport")
+        self.assertIsNone(ExpenseTracker().get_most_frequent_category())
+    
+    def test_top_categories(self):
+        """Test top-k categories by count"""
+        self.assertEqual(self.tracker.top_categories(2), [("Food", 3), ("Transport", 2)])
+        self.assertEqual(len(self.tracker.top_categories(10)), 3)
+    
+    def test_bounded_category_counts(self):
+        """Test max_categories keeps heavy hitters with a capped table"""
+        bounded = ExpenseTracker(max_categories=2)
+        for i in range(30):
+            bounded.add_expense(Expense(5, "Food", "meal", "2024-01-01"))
+            bounded.add_expense(Expense(5, f"Shop {i}", "one-off", "2024-01-01"))
+        self.assertEqual(bounded.get_most_frequent_category(), "Food")
+        self.assertEqual(bounded.top_categories(1), [("Food", 30)])
+        self.assertEqual(len(bounded._category_counter), 2)
+    
+    def test_category_spending(self):
+        """Test per-category amount table"""
+        spending = self.tracker.get_category_spending()
+        self.assertEqual(spending["Transport"], 55)
+        self.assertAlmostEqual(spending["Food"], 115.74)
+
+
+class TestColumnarExpenseTracker(unittest.TestCase):
+    """Tests for the array-backed expense store"""
+    
+    def setUp(self):
+        """Build matching object and columnar trackers"""
+        self.rows = [
+            (1200, "Housing", "Rent", "2024-01-01"),
+            (80.5, "Food", "Groceries", "2024-01-03"),
+            (40, "Transport", "Gas", "2024-02-04"),
+            (25.25, "Food", "Groceries", "2024-02-05"),
+            (9.99, "Food", "Coffee", "2024-03-07"),
+        ]
+        self.tracker = ExpenseTracker()
+        self.columnar = ColumnarExpenseTracker()
+        for amount, category, description, date in self.rows:
+            self.tracker.add_expense(Expense(amount, category, description, date))
+            self.columnar.add(amount, category, description, date)
+    
+    def test_same_api_results(self):
+        """Test aggregates match the object-based tracker"""
+        self.assertEqual(self.columnar.get_total_spending(), self.tracker.get_total_spending())
+        self.assertEqual(self.columnar.get_most_frequent_category(), self.tracker.get_most_frequent_category())
+        self.assertEqual(self.columnar.top_categories(2), self.tracker.top_categories(2))
+        self.assertEqual(self.columnar.get_category_spending(), self.tracker.get_category_spending())
+        self.assertEqual(len(self.columnar), 5)
+    
+    def test_round_trips_expenses(self):
+        """Test rows come back as equivalent Expense objects"""
+        first = next(iter(self.columnar))
+        self.assertEqual(first.to_dict(), Expense(1200, "Housing", "Rent", "2024-01-01").to_dict())
+        self.columnar.add_expense(Expense(5, "Food", "Snack", "2024-03-08"))
+        self.assertEqual(self.columnar.expense(5).description, "Snack")
+    
+    def test_filter_and_group(self):
+        """Test filters and group-bys over the columns"""
+        food = self.columnar.filter(category="Food", start="2024-01-01", end="2024-02-29")
+        self.assertEqual(len(food), 2)
+        self.assertEqual(food.get_total_spending(), 80.5 + 25.25)
+        self.assertEqual(len(self.columnar.filter(min_amount=40, max_amount=100)), 2)
+        self.assertEqual(len(self.columnar.filter(category="Missing")), 0)
+        
+        by_month = self.columnar.group_by_month()
+        self.assertEqual(list(by_month), [(2024, 1), (2024, 2), (2024, 3)])
+        self.assertAlmostEqual(by_month[(2024, 2)], 65.25)
+        self.assertAlmostEqual(self.columnar.group_by_category()["Food"], 115.74)
+    
+    def test_validation(self):
+        """Test the same amount and date checks as Expense"""
+        with self.assertRaises(ValueError):
+            self.columnar.add(-5, "Food", "Refund", "2024-01-01")
+        with self.assertRaises(ValueError):
+            self.columnar.add(5, "Food", "Snack", "01/01/2024")
+        with self.assertRaises(TypeError):
+            self.columnar.add_expense("not an expense")
+
+
+class TestExpenseConstruction(unittest.TestCase):
+    """Tests for the slotted Expense and its bulk constructor"""
+    
+    def test_slots(self):
+        """Test that expenses carry no per-instance __dict__"""
+        e = Expense(10, "Food", "Lunch", "2024-01-15")
+        self.assertFalse(hasattr(e, "__dict__"))
+        self.assertEqual(Expense(10, "Food", "Lunch", "2024-1-5").date.isoformat(), "2024-01-05")
+    
+    def test_from_records(self):
+        """Test bulk construction from tuples and dicts"""
+        expenses = Expense.from_records([
+            (150.0, "Food ", " Grocery", "2024-01-15"),
+            {"amount": 40, "category": "Transport", "description": "Gas", "date": "2024-01-17"},
+        ])
+        self.assertEqual(expenses[0].to_dict(), Expense(150.0, "Food", "Grocery", "2024-01-15").to_dict())
+        self.assertEqual(expenses[1].date.day, 17)
+    
+    def test_from_records_validation(self):
+        """Test that the first invalid row is reported"""
+        with self.assertRaisesRegex(ValueError, "Row 1"):
+            Expense.from_records([(1, "Food", "a", "2024-01-01"), (0, "Food", "b", "2024-01-01")])
+        with self.assertRaisesRegex(ValueError, "Row 0: Invalid date"):
+            Expense.from_records([(1, "Food", "a", "01/01/2024")])
+
+
+class TestExpenseTrackerDateQueries(unittest.TestCase):
+    """Tests for the date-sorted index on ExpenseTracker"""
+    
+    def setUp(self):
+        """Add expenses out of date order"""
+        self.tracker = ExpenseTracker()
+        for amount, category, date in [
+            (10, "Food", "2024-01-10"),
+            (20, "Food", "2024-01-20"),
+            (5, "Transport", "2024-01-05"),
+            (30, "Housing", "2024-01-30"),
+            (15, "Transport", "2024-01-15"),
+            (25, "Food", "2024-01-25"),
+        ]:
+            self.tracker.add_expense(Expense(amount, category, "item", date))
+    
+    def test_expenses_between(self):
+        """Test inclusive date range queries come back in date order"""
+        found = self.tracker.expenses_between("2024-01-10", "2024-01-25")
+        self.assertEqual([e.amount for e in found], [10, 15, 20, 25])
+        self.assertEqual(self.tracker.expenses_between("2024-02-01", "2024-02-28"), [])
+    
+    def test_spending_between(self):
+        """Test range totals with and without a category"""
+        self.assertEqual(self.tracker.spending_between("2024-01-01", "2024-01-31"), 105)
+        self.assertEqual(self.tracker.spending_between("2024-01-01", "2024-01-20", "Food"), 30)
+    
+    def test_latest(self):
+        """Test latest returns newest first and sees later adds"""
+        self.assertEqual([e.amount for e in self.tracker.latest(2)], [30, 25])
+        self.tracker.add_expense(Expense(1, "Food", "late entry", "2024-01-01"))
+        self.tracker.add_expense(Expense(2, "Food", "newest", "2024-02-01"))
+        self.assertEqual([e.amount for e in self.tracker.latest(2)], [2, 30])
+        self.assertEqual(self.tracker.expenses_between("2024-01-01", "2024-01-05")[0].amount, 1)
+    
+    def test_interleaved_late_adds_and_queries(self):
+        """Test late adds mixed with queries stay sorted and don't rebuild the index each time"""
+        tracker = ExpenseTracker()
+        base = date(2020, 1, 1).toordinal()
+        for i in range(20000):
+            tracker.add_expense(Expense(1, "Food", "meal", date.fromordinal(base + i // 10).isoformat()))
+        rng = random.Random(5)
+        start = time.perf_counter()
+        for i in range(2000):
+            day = date.fromordinal(base + rng.randint(0, 1999))
+            tracker.add_expense(Expense(2, "Late", f"late {i}", day.isoformat()))
+            tracker.latest(1)
+        self.assertLess(time.perf_counter() - start, 1.5)
+        
+        dates = [e.date for e in tracker._sorted_by_date()]
+        self.assertEqual(dates, sorted(dates))
+        self.assertEqual(tracker._date_keys, dates)
+        self.assertEqual(len(tracker.expenses_between("2020-01-01", "2030-01-01")), 22000)
+
+
+class TestIncrementalSave(unittest.TestCase):
+    """Tests for checkpointed save_to_file"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, "monthly_spending.txt")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def read_lines(self):
+        with open(self.filename) as f:
+            return f.read().splitlines()
+    
+    def test_second_save_appends_only_new_expenses(self):
+        """Test that saving twice does not duplicate history"""
+        for tracker in (ExpenseTracker(), ColumnarExpenseTracker()):
+            tracker.add_expense(Expense(10, "Food", "Lunch", "2024-01-01"))
+            tracker.save_to_file(self.filename)
+            tracker.save_to_file(self.filename)
+            tracker.add_expense(Expense(20, "Transport", "Bus pass", "2024-01-02"))
+            tracker.save_to_file(self.filename, fsync=True)
+            self.assertEqual(len(self.read_lines()), 2)
+            os.remove(self.filename)
+    
+    def test_deleted_file_is_rewritten(self):
+        """Test that a removed file gets the full history again"""
+        tracker = ExpenseTracker()
+        tracker.add_expense(Expense(10, "Food", "Lunch", "2024-01-01"))
+        tracker.save_to_file(self.filename)
+        os.remove(self.filename)
+        tracker.save_to_file(self.filename)
+        self.assertEqual(self.read_lines(), ["2024-01-01,10,Food,Lunch"])
+    
+    def test_load_resumes_from_file(self):
+        """Test that a reloaded tracker only appends what was added after loading"""
+        tracker = ExpenseTracker()
+        tracker.add_expense(Expense(10, "Food", "Lunch, with tip", "2024-01-01"))
+        tracker.save_to_file(self.filename)
+        
+        reloaded = ExpenseTracker.load_from_file(self.filename)
+        self.assertEqual(reloaded.get_total_spending(), 10)
+        reloaded.add_expense(Expense(5, "Food", "Coffee", "2024-01-02"))
+        reloaded.save_to_file(self.filename)
+        self.assertEqual(self.read_lines(), ["2024-01-01,10,Food,Lunch, with tip",
+                                             "2024-01-02,5,Food,Coffee"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,293 @@
+import unittest
+import sys
+import json
+import io
+import tempfile
+import shutil
+from contextlib import redirect_stdout
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'classes'))
+from file_handler import FileHandler
+
+
+class TestStreamingImport(unittest.TestCase):
+    """Tests for the generator and chunked CSV import paths"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.file_handler = FileHandler(self.test_dir)
+        self.csv_path = Path(self.test_dir) / "test.csv"
+        with self.csv_path.open('w') as f:
+            f.write("date,description,amount,category\n")
+            for day in range(1, 8):
+                f.write(f"2024-01-{day:02d},Purchase {day},{day * 10}.00,Food\n")
+            f.write("2024-01-08,Refund,-5.00,Food\n")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_iter_matches_list_import(self):
+        """Test that the generator yields the same rows as the list import"""
+        with redirect_stdout(io.StringIO()):
+            streamed = list(self.file_handler.iter_transactions_from_csv(self.csv_path))
+            imported = self.file_handler.import_transactions_from_csv(self.csv_path)
+        self.assertEqual(streamed, imported)
+        self.assertEqual(len(streamed), 7)
+    
+    def test_iter_is_lazy(self):
+        """Test that rows are available before the file is fully read"""
+        rows = self.file_handler.iter_transactions_from_csv(self.csv_path)
+        first = next(rows)
+        self.assertEqual(first['description'], "Purchase 1")
+        rows.close()
+    
+    def test_chunks(self):
+        """Test chunked import yields lists of at most chunk_size rows"""
+        with redirect_stdout(io.StringIO()):
+            chunks = list(self.file_handler.iter_transaction_chunks_from_csv(self.csv_path, chunk_size=3))
+        self.assertEqual([len(c) for c in chunks], [3, 3, 1])
+    
+    def test_missing_file_raises_immediately(self):
+        """Test that a missing file is reported before iteration starts"""
+        with self.assertRaises(FileNotFoundError):
+            self.file_handler.iter_transactions_from_csv(Path(self.test_dir) / "missing.csv")
+    
+    def test_bad_headers(self):
+        """Test that header validation still applies to streamed imports"""
+        bad = Path(self.test_dir) / "bad.csv"
+        bad.write_text("when,what\n2024-01-01,Coffee\n")
+        with self.assertRaises(IOError):
+            list(self.file_handler.iter_transactions_from_csv(bad))
+
+
+class TestImportDirectory(unittest.TestCase):
+    """Tests for parallel multi-file import"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.file_handler = FileHandler(self.test_dir)
+        self.statements = Path(self.test_dir) / "statements"
+        self.statements.mkdir()
+        (self.statements / "checking.csv").write_text(
+            "date,description,amount,category\n"
+            "2024-01-20,Rent,1200.00,Housing\n"
+            "2024-01-03,Groceries,80.00,Food\n"
+        )
+        (self.statements / "credit.csv").write_text(
+            "date,description,amount,category\n"
+            "2024-01-10,Gas,40.00,Transport\n"
+            "2024-01-11,Refund,-15.00,Shopping\n"
+        )
+        (self.statements / "broken.csv").write_text("when,what\n2024-01-01,Coffee\n")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_merges_files_in_date_order(self):
+        """Test that rows from all files come back merged by date"""
+        result = self.file_handler.import_directory(self.statements, workers=2)
+        dates = [t['date'] for t in result['transactions']]
+        self.assertEqual(dates, ["2024-01-03", "2024-01-10", "2024-01-20"])
+        self.assertEqual(result['accepted'], 3)
+        self.assertEqual(result['rejected'], 1)
+    
+    def test_per_file_stats(self):
+        """Test per-file accepted/rejected counts, timing and errors"""
+        result = self.file_handler.import_directory(self.statements, workers=1)
+        stats = {f['file']: f for f in result['files']}
+        self.assertEqual(stats['checking.csv']['accepted'], 2)
+        self.assertEqual(stats['credit.csv']['rejected'], 1)
+        self.assertIsNotNone(stats['broken.csv']['error'])
+        self.assertGreaterEqual(stats['credit.csv']['parse_time'], 0)
+
+
+class TestCsvFormatDetection(unittest.TestCase):
+    """Tests for header/date/amount sniffing of bank exports"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.file_handler = FileHandler(self.test_dir)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_bank_export_format(self):
+        """Test BOM, capitalized headers, $ amounts, M/D/YY dates and padding"""
+        csv_path = Path(self.test_dir) / "bank.csv"
+        csv_path.write_bytes(
+            "\ufeffDate,Description,Amount,Category,,,\r\n"
+            "1/5/24,Whole Foods Market, $127.43 ,Food,,,\r\n"
+            '1/7/24,Shell Gas Station,"$1,045.00",Transport ,,,\r\n'.encode('utf-8')
+        )
+        transactions = self.file_handler.import_transactions_from_csv(csv_path)
+        self.assertEqual(transactions[0], {
+            'date': '2024-01-05', 'description': 'Whole Foods Market',
+            'amount': 127.43, 'category': 'Food'
+        })
+        self.assertEqual(transactions[1]['amount'], 1045.0)
+        self.assertEqual(transactions[1]['category'], 'Transport')
+    
+    def test_one_bad_sample_date(self):
+        """Test that one unparseable date in the sample doesn't reject the whole file"""
+        csv_path = Path(self.test_dir) / "bank_na.csv"
+        rows = [f"1/{day}/24,Purchase {day},{day}.00,Food" for day in range(1, 25)]
+        rows[3] = "N/A,Pending charge,9.99,Food"
+        csv_path.write_text("Date,Description,Amount,Category\n" + "\n".join(rows) + "\n")
+        result = self.file_handler.import_csv_with_report(csv_path)
+        self.assertEqual(result.accepted_count, 23)
+        self.assertEqual(result.rejected_count, 1)
+        self.assertEqual(dict(result.error_counts), {'invalid_date': 1})
+        self.assertEqual(result.transactions[0]['date'], '2024-01-01')
+    
+    def test_currency_amount_after_sample(self):
+        """Test that a "$1,200.00" amount past the sampled rows is still parsed"""
+        csv_path = Path(self.test_dir) / "late_currency.csv"
+        rows = [f"2024-01-{day:02d},Purchase {day},{day}.00,Food" for day in range(1, 27)]
+        rows.append('2024-01-27,Rent,"$1,200.00",Housing')
+        csv_path.write_text("Date,Description,Amount,Category\n" + "\n".join(rows) + "\n")
+        result = self.file_handler.import_csv_with_report(csv_path)
+        self.assertEqual(result.accepted_count, 27)
+        self.assertEqual(result.rejected_count, 0)
+        self.assertEqual(result.transactions[-1]['amount'], 1200.0)
+    
+    def test_sample_transactions_file(self):
+        """Test that the bundled sample bank export imports fully"""
+        sample = Path(__file__).parent.parent / 'data' / 'sample_transactions.csv'
+        transactions = self.file_handler.import_transactions_from_csv(sample)
+        self.assertEqual(len(transactions), 30)
+    
+    def test_reordered_columns(self):
+        """Test that columns are found by name, not position"""
+        csv_path = Path(self.test_dir) / "reordered.csv"
+        csv_path.write_text("category,amount,date,description\nFood,5.50,2024-01-16,Coffee\n")
+        transactions = self.file_handler.import_transactions_from_csv(csv_path)
+        self.assertEqual(transactions[0]['description'], 'Coffee')
+        self.assertEqual(transactions[0]['date'], '2024-01-16')
+    
+    def test_invalid_dates_rejected(self):
+        """Test that empty or unparseable dates are skipped"""
+        csv_path = Path(self.test_dir) / "dates.csv"
+        csv_path.write_text(
+            "date,description,amount,category\n"
+            "2024-01-15,Valid,50.00,Food\n"
+            ",Missing Date,30.00,Food\n"
+            "2024-13-01,Bad Month,30.00,Food\n"
+        )
+        with redirect_stdout(io.StringIO()):
+            transactions = self.file_handler.import_transactions_from_csv(csv_path)
+        self.assertEqual([t['description'] for t in transactions], ['Valid'])
+
+
+class TestImportReport(unittest.TestCase):
+    """Tests for ImportResult and the strict/skip/collect modes"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.file_handler = FileHandler(self.test_dir)
+        self.csv_path = Path(__file__).parent.parent / 'data' / 'invalid_test.csv'
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_collect_mode(self):
+        """Test that rejected rows are sampled with line numbers and reasons"""
+        result = self.file_handler.import_csv_with_report(self.csv_path, mode="collect")
+        self.assertEqual(result.accepted_count, 2)
+        self.assertEqual(result.rejected_count, 4)
+        self.assertEqual(result.error_counts["non_positive_amount"], 2)
+        self.assertEqual(result.error_counts["missing_date"], 1)
+        self.assertEqual(result.error_counts["invalid_amount"], 1)
+        first = result.rejected_samples[0]
+        self.assertEqual(first["line"], 3)
+        self.assertEqual(first["error_type"], "non_positive_amount")
+    
+    def test_samples_are_capped(self):
+        """Test that only max_samples rejected rows are kept"""
+        result = self.file_handler.import_csv_with_report(self.csv_path, max_samples=1)
+        self.assertEqual(len(result.rejected_samples), 1)
+        self.assertEqual(result.rejected_count, 4)
+    
+    def test_skip_mode_keeps_counts_only(self):
+        """Test that skip mode counts rejects without sampling them"""
+        result = self.file_handler.import_csv_with_report(self.csv_path, mode="skip")
+        self.assertEqual(result.rejected_count, 4)
+        self.assertEqual(result.rejected_samples, [])
+    
+    def test_strict_mode_fails_on_first_invalid_row(self):
+        """Test that strict mode stops at the first invalid row"""
+        with self.assertRaises(IOError) as ctx:
+            self.file_handler.import_csv_with_report(self.csv_path, mode="strict")
+        self.assertIn("line 3", str(ctx.exception))
+    
+    def test_list_import_prints_one_summary(self):
+        """Test that the list import warns once instead of once per row"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            transactions = self.file_handler.import_transactions_from_csv(self.csv_path)
+        self.assertEqual(len(transactions), 2)
+        self.assertEqual(len(output.getvalue().splitlines()), 1)
+
+
+class TestBatchReports(unittest.TestCase):
+    """Tests for multi-user monthly report export"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.file_handler = FileHandler(self.test_dir)
+        for i in range(5):
+            self.file_handler.save_user_profile(f"user{i}", 1000 + i, "Ohio", [
+                {"date": "2024-01-05", "description": "Rent", "amount": 500.0, "category": "Housing"},
+                {"date": "2024-02-10", "description": "Food", "amount": 75.5, "category": "Food"},
+                {"date": "2024-02-11", "description": "Gas", "amount": 24.5, "category": "Transport"},
+                {"date": "2023-12-31", "description": "Gift", "amount": 30.0, "category": "Gifts"},
+            ])
+        self.usernames = self.file_handler.list_users() + ["ghost"]
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def load_report(self, username, year, month):
+        path = Path(self.test_dir) / "reports" / f"{username}_report_{year}_{month:02d}.json"
+        with path.open() as f:
+            return json.load(f)
+    
+    def test_reports_match_single_export(self):
+        """Test batch reports match export_monthly_report per user and month"""
+        progress = []
+        result = self.file_handler.export_monthly_reports_batch(
+            self.usernames, (2024, 1), (2024, 3), tax_rate=0.2,
+            workers=2, shard_size=2, progress=lambda done, total: progress.append((done, total)))
+        
+        self.assertEqual(result['reports'], 15)
+        self.assertEqual(result['failed'], 1)
+        self.assertEqual(progress[-1], (6, 6))
+        self.assertEqual([u['username'] for u in result['users']], self.usernames)
+        self.assertEqual(result['users'][0]['transactions'], 3)
+        self.assertIsNotNone(result['users'][-1]['error'])
+        
+        february = self.load_report("user1", 2024, 2)
+        self.assertEqual(february['total_spent'], 100.0)
+        self.assertAlmostEqual(february['after_tax_income'], 1001 * 0.8)
+        self.assertEqual(february['category_breakdown'], {"Food": 75.5, "Transport": 24.5})
+        self.assertEqual(self.load_report("user1", 2024, 3)['transaction_count'], 0)
+    
+    def test_invalid_arguments(self):
+        """Test bad ranges and tax rates"""
+        with self.assertRaises(ValueError):
+            self.file_handler.export_monthly_reports_batch(self.usernames, (2024, 3), (2024, 1))
+        with self.assertRaises(ValueError):
+            self.file_handler.export_monthly_reports_batch(self.usernames, (2024, 1), (2024, 1), tax_rate=1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
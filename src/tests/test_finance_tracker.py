@@ -0,0 +1,314 @@
+import unittest
+import sys
+import os
+import io
+import random
+import tempfile
+import shutil
+import time
+from contextlib import redirect_stdout
+from datetime import date
+from pathlib import Path
+from unittest import mock
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from finance_tracker import FinanceTracker, DateRangeTotals
+
+
+class TestFinanceTrackerJournal(unittest.TestCase):
+    """Tests for the append-only journal storage mode"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, 'finance_data.json')
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def make_tracker(self, **kwargs):
+        return FinanceTracker(self.filename, **kwargs)
+    
+    def test_entries_are_appended_to_journal(self):
+        """Test that journal mode appends instead of rewriting the snapshot"""
+        tracker = self.make_tracker(journal=True)
+        with redirect_stdout(io.StringIO()):
+            tracker.add_income(3000, 'Salary', '2024-01-01')
+            tracker.add_expense(50, 'Food', 'Groceries', '2024-01-02')
+        
+        self.assertFalse(os.path.exists(self.filename))
+        with open(tracker.journal_filename) as f:
+            self.assertEqual(len(f.readlines()), 2)
+    
+    def test_load_replays_snapshot_and_journal(self):
+        """Test that a reload sees both snapshot and journaled entries"""
+        tracker = self.make_tracker(journal=True)
+        with redirect_stdout(io.StringIO()):
+            tracker.add_income(3000, 'Salary', '2024-01-01')
+            tracker.compact()
+            tracker.add_expense(50, 'Food', 'Groceries', '2024-01-02')
+        
+        reloaded = self.make_tracker(journal=True)
+        self.assertEqual(len(reloaded.data['income']), 1)
+        self.assertEqual(len(reloaded.data['expenses']), 1)
+        self.assertEqual(reloaded.data['expenses'][0]['description'], 'Groceries')
+    
+    def test_threshold_triggers_compaction(self):
+        """Test that the journal is folded into the snapshot at the threshold"""
+        tracker = self.make_tracker(journal=True, compact_threshold=3)
+        with redirect_stdout(io.StringIO()):
+            for day in range(1, 4):
+                tracker.add_expense(10, 'Food', 'Lunch', f'2024-01-0{day}')
+        
+        self.assertTrue(os.path.exists(self.filename))
+        self.assertFalse(os.path.exists(tracker.journal_filename))
+        self.assertEqual(len(self.make_tracker().data['expenses']), 3)
+    
+    def test_torn_journal_tail_is_dropped(self):
+        """Test that a partially written last record is ignored and truncated"""
+        tracker = self.make_tracker(journal=True)
+        with redirect_stdout(io.StringIO()):
+            tracker.add_expense(10, 'Food', 'Lunch', '2024-01-01')
+        with open(tracker.journal_filename, 'a') as f:
+            f.write('["expenses",{"amount":')
+        
+        reloaded = self.make_tracker(journal=True)
+        self.assertEqual(len(reloaded.data['expenses']), 1)
+        with redirect_stdout(io.StringIO()):
+            reloaded.add_expense(20, 'Food', 'Dinner', '2024-01-01')
+        self.assertEqual(len(self.make_tracker().data['expenses']), 2)
+    
+    def test_crash_during_compaction_does_not_replay_journal(self):
+        """Test a crash at either step of the snapshot swap loses and duplicates nothing"""
+        real_replace = os.replace
+        
+        def replace_fails_on_snapshot(src, dst):
+            if dst == self.filename:
+                raise OSError("simulated crash")
+            real_replace(src, dst)
+        
+        for step, patch in (('remove', mock.patch.object(os, 'remove', side_effect=OSError("simulated crash"))),
+                            ('replace', mock.patch.object(os, 'replace', side_effect=replace_fails_on_snapshot))):
+            with self.subTest(step=step):
+                for name in os.listdir(self.test_dir):
+                    os.remove(os.path.join(self.test_dir, name))
+                tracker = self.make_tracker(journal=True)
+                with redirect_stdout(io.StringIO()):
+                    for day in range(1, 6):
+                        tracker.add_expense(10, 'Food', 'Lunch', f'2024-01-0{day}')
+                with patch, self.assertRaises(OSError):
+                    tracker.compact()
+                
+                reloaded = self.make_tracker(journal=True)
+                self.assertEqual(len(reloaded.data['expenses']), 5)
+                self.assertEqual(reloaded.get_expense_total('2024-01-01', '2024-01-31'), 50)
+                self.assertEqual(sorted(os.listdir(self.test_dir)), ['finance_data.json'])
+
+
+class TestFinanceTrackerMonthlyQueries(unittest.TestCase):
+    """Tests for the (year, month) index behind the monthly totals"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, 'finance_data.json')
+        self.tracker = FinanceTracker(self.filename)
+        with redirect_stdout(io.StringIO()):
+            self.tracker.add_income(3000, 'Salary', '2024-01-01')
+            self.tracker.add_income(500, 'Freelance', '2024-02-10')
+            self.tracker.add_expense(1200, 'Housing', 'Rent', '2024-01-05')
+            self.tracker.add_expense(80, 'Food', 'Groceries', '2024-01-09')
+            self.tracker.add_expense(40, 'Food', 'Takeout', '2024-02-11')
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_monthly_totals_only_include_that_month(self):
+        """Test that monthly income and expenses are bucketed by month"""
+        self.assertEqual(self.tracker.get_monthly_income(1, 2024), 3000)
+        self.assertEqual(self.tracker.get_monthly_income(2, 2024), 500)
+        total, breakdown = self.tracker.get_monthly_expenses(1, 2024)
+        self.assertEqual(total, 1280)
+        self.assertEqual(breakdown, {'Housing': 1200, 'Food': 80})
+        self.assertEqual(self.tracker.get_monthly_expenses(3, 2024), (0, {}))
+    
+    def test_index_is_rebuilt_on_load(self):
+        """Test that a reloaded tracker answers the same monthly queries"""
+        reloaded = FinanceTracker(self.filename)
+        self.assertEqual(reloaded.get_monthly_expenses(2, 2024), (40, {'Food': 40}))
+    
+    def test_invalid_date_is_rejected_before_saving(self):
+        """Test that an unparseable date never reaches the data file"""
+        with self.assertRaises(ValueError):
+            self.tracker.add_expense(10, 'Food', 'Snack', '01/15/2024')
+        self.assertEqual(len(FinanceTracker(self.filename).data['expenses']), 3)
+
+
+class TestFinanceTrackerBulkInsert(unittest.TestCase):
+    """Tests for bulk adds and the batch() context manager"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, 'finance_data.json')
+        self.tracker = FinanceTracker(self.filename)
+        self.records = [
+            {'date': '2024-01-15', 'description': 'Grocery', 'amount': 150.0, 'category': 'Food'},
+            {'date': '2024-01-17', 'description': 'Gas', 'amount': 40.0, 'category': 'Transport'}
+        ]
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_bulk_expenses_saved_once(self):
+        """Test that a bulk add saves every record and prints one line"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            count = self.tracker.add_expenses_bulk(self.records)
+        
+        self.assertEqual(count, 2)
+        self.assertEqual(len(output.getvalue().splitlines()), 1)
+        self.assertEqual(len(FinanceTracker(self.filename).data['expenses']), 2)
+        self.assertEqual(self.tracker.get_monthly_expenses(1, 2024)[0], 190.0)
+    
+    def test_bulk_is_all_or_nothing(self):
+        """Test that one invalid record discards the whole bulk add"""
+        bad = self.records + [{'date': '2024-01-18', 'description': 'Oops', 'amount': 'abc', 'category': 'Food'}]
+        with self.assertRaises(ValueError):
+            self.tracker.add_expenses_bulk(bad)
+        
+        self.assertEqual(self.tracker.data['expenses'], [])
+        self.assertEqual(self.tracker.get_monthly_expenses(1, 2024), (0, {}))
+        self.assertFalse(os.path.exists(self.filename))
+    
+    def test_batch_defers_save_until_exit(self):
+        """Test that nothing is written until the batch block exits"""
+        with redirect_stdout(io.StringIO()):
+            with self.tracker.batch():
+                self.tracker.add_income(3000, 'Salary', '2024-01-01')
+                self.tracker.add_expenses_bulk(self.records)
+                self.assertFalse(os.path.exists(self.filename))
+        
+        reloaded = FinanceTracker(self.filename)
+        self.assertEqual(len(reloaded.data['income']), 1)
+        self.assertEqual(len(reloaded.data['expenses']), 2)
+    
+    def test_journal_batch_appends_in_one_pass(self):
+        """Test that a journaled batch lands in the journal together"""
+        tracker = FinanceTracker(self.filename, journal=True)
+        with redirect_stdout(io.StringIO()):
+            tracker.add_incomes_bulk([{'amount': 3000, 'source': 'Salary', 'date': '2024-01-01'}])
+            tracker.add_expenses_bulk(self.records)
+        
+        with open(tracker.journal_filename) as f:
+            self.assertEqual(len(f.readlines()), 3)
+        self.assertEqual(FinanceTracker(self.filename).get_monthly_income(1, 2024), 3000)
+
+
+class TestDateRangeTotals(unittest.TestCase):
+    """Tests for the Fenwick-tree backed date-range aggregation"""
+    
+    def test_matches_linear_scan(self):
+        """Test arbitrary windows against a brute-force sum"""
+        rng = random.Random(7)
+        totals = DateRangeTotals()
+        entries = []
+        base = date(2024, 6, 1).toordinal()
+        for _ in range(500):
+            day = date.fromordinal(base + rng.randint(-400, 400))
+            amount = rng.randint(1, 500)
+            category = rng.choice(['Food', 'Housing', 'Transport'])
+            totals.add(day, amount, category)
+            entries.append((day, amount, category))
+        
+        for _ in range(200):
+            start = date.fromordinal(base + rng.randint(-450, 450))
+            end = date.fromordinal(start.toordinal() + rng.randint(0, 120))
+            expected = sum(a for d, a, c in entries if start <= d <= end)
+            food = sum(a for d, a, c in entries if start <= d <= end and c == 'Food')
+            self.assertEqual(totals.total(start, end), expected)
+            self.assertEqual(totals.total(start, end, 'Food'), food)
+    
+    def test_far_off_dates_stay_cheap(self):
+        """Test typo years and out-of-order days don't blow up the trees"""
+        totals = DateRangeTotals()
+        start = time.perf_counter()
+        for i, day in enumerate(['2024-03-01', '0001-01-01', '9999-12-31'] * 3):
+            totals.add(day, 10, f"Category {i}")
+        for offset in range(300, 0, -1):  # backdated days go through the pending set
+            totals.add(date.fromordinal(date(2024, 1, 1).toordinal() + offset), 1, 'Food')
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertLess(max(len(tree) for tree in totals._trees.values()), 2000)
+        self.assertEqual(totals.total('0001-01-01', '9999-12-31'), 390)
+        self.assertEqual(totals.total('2024-01-02', '2024-02-29', 'Food'), 59)
+        self.assertEqual(totals.total('9999-01-01', '9999-12-31', 'Category 2'), 10)
+    
+    def test_tracker_range_queries(self):
+        """Test the tracker's range totals stay current on every add"""
+        test_dir = tempfile.mkdtemp()
+        try:
+            tracker = FinanceTracker(os.path.join(test_dir, 'finance_data.json'))
+            with redirect_stdout(io.StringIO()):
+                tracker.add_income(2000, 'Salary', '2024-01-01')
+                tracker.add_income(2000, 'Salary', '2024-01-15')
+                tracker.add_expense(1200, 'Housing', 'Rent', '2024-01-05')
+                tracker.add_expense(60, 'Food', 'Groceries', '2024-01-14')
+                tracker.add_expense(25, 'Food', 'Lunch', '2023-12-30')
+            
+            self.assertEqual(tracker.get_income_total('2024-01-01', '2024-01-14'), 2000)
+            self.assertEqual(tracker.get_expense_total('2023-12-01', '2024-01-31'), 1285)
+            self.assertEqual(tracker.get_expense_total('2024-01-01', '2024-12-31', 'Food'), 60)
+            self.assertEqual(tracker.get_expense_breakdown('2024-01-01', '2024-01-31'),
+                             {'Housing': 1200, 'Food': 60})
+        finally:
+            shutil.rmtree(test_dir)
+
+
+class TestFinanceTrackerAnomalies(unittest.TestCase):
+    """Tests for scoring expenses as they are added"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, 'finance_data.json')
+        self.records = [{'amount': 30 + i % 7, 'category': 'Food', 'description': 'Lunch', 'date': '2024-01-05'}
+                        for i in range(40)]
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_flags_unusual_expense(self):
+        """Test add_expense warns about an outlier and returns its score"""
+        tracker = FinanceTracker(self.filename, detect_anomalies=True)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            tracker.add_expenses_bulk(self.records)
+            normal = tracker.add_expense(33, 'Food', 'Lunch', '2024-01-06')
+            unusual = tracker.add_expense(250, 'Food', 'Catering', '2024-01-06')
+        self.assertFalse(normal.is_anomaly)
+        self.assertTrue(unusual.is_anomaly)
+        self.assertIn("Unusual expense: $250", output.getvalue())
+    
+    def test_restart_replays_only_journal_tail(self):
+        """Test stats saved with the snapshot plus the journal tail rebuild the detector"""
+        with redirect_stdout(io.StringIO()):
+            tracker = FinanceTracker(self.filename, journal=True, detect_anomalies=True)
+            tracker.add_expenses_bulk(self.records)
+            tracker.compact()
+            tracker.add_expense(31, 'Food', 'Lunch', '2024-01-06')
+            with self.assertRaises(ValueError):
+                with tracker.batch():
+                    tracker.add_expense(32, 'Food', 'Lunch', '2024-01-07')
+                    raise ValueError("abort")
+        self.assertEqual(tracker.anomaly_detector.seen, 41)
+        
+        restarted = FinanceTracker(self.filename, journal=True, detect_anomalies=True)
+        self.assertEqual(restarted.anomaly_detector.to_dict(), tracker.anomaly_detector.to_dict())
+        self.assertIsNone(FinanceTracker(self.filename, journal=True).anomaly_detector)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import io
+import subprocess
+import tempfile
+import shutil
+from contextlib import redirect_stdout
+from unittest import mock
+from pathlib import Path
+CLASSES_DIR = Path(__file__).parent.parent / 'classes'
+sys.path.insert(0, str(CLASSES_DIR))
+import Function_Library
+
+
+class TestFunctionLibrary(unittest.TestCase):
+    """Tests for the side-effect-free function library"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_import_does_no_io(self):
+        """Test importing with no stdin neither prompts nor writes files"""
+        result = subprocess.run(
+            [sys.executable, "-c", "import Function_Library, sys; "
+             "assert 'Transaction' not in sys.modules"],
+            cwd=self.test_dir, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+            env={**os.environ, "PYTHONPATH": str(CLASSES_DIR)})
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "")
+        self.assertEqual(os.listdir(self.test_dir), [])
+    
+    def test_username_creation_appends(self):
+        """Test usernames are added to users.txt instead of replacing it"""
+        users = os.path.join(self.test_dir, "users.txt")
+        with redirect_stdout(io.StringIO()):
+            for name in ["alice", "bob"]:
+                with mock.patch("builtins.input", return_value=name):
+                    Function_Library.username_creation(users)
+        with open(users) as f:
+            self.assertEqual(f.read(), "alice\nbob\n")
+        self.assertTrue(Function_Library.is_username_taken_from_file("BOB", users))
+    
+    def test_library_functions(self):
+        """Test pure helpers and the state list"""
+        self.assertEqual(Function_Library.calculate_money_available_after_tax(1000, 0.25), 750)
+        self.assertIn("Arizona", Function_Library.states)
+        self.assertIn("Arkansas", Function_Library.states)
+        spending = os.path.join(self.test_dir, "monthly_spending.txt")
+        with open(spending, "w") as f:
+            f.write("January,5.0,Food,Lunch\nJanuary,9.0,Food,Dinner\nJanuary,3.0,Fun,Game\n")
+        self.assertEqual(Function_Library.get_most_frequent_transaction_category(spending), "Food")
+
+
+if __name__ == '__main__':
+    unittest.main()
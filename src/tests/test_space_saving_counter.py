@@ -0,0 +1,48 @@
+import unittest
+import sys
+import random
+from collections import Counter
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'classes'))
+from SpaceSavingCounter import SpaceSavingCounter
+
+
+class TestSpaceSavingCounter(unittest.TestCase):
+    """Tests for the bounded-memory top-k counter"""
+    
+    def test_exact_when_distinct_items_fit(self):
+        """Test that counts and tie order match Counter within capacity"""
+        items = ["Rent", "Food", "Food", "Fun", "Rent", "Gas"]
+        counter = SpaceSavingCounter(capacity=4)
+        counter.update(items)
+        expected = Counter(items)
+        self.assertEqual(counter.most_frequent(), expected.most_common(1)[0][0])
+        self.assertEqual([(i, c) for i, c, e in counter.top(4)], expected.most_common(4))
+        self.assertTrue(all(e == 0 for _, _, e in counter.top(4)))
+    
+    def test_memory_and_error_bounds(self):
+        """Test heavy hitters survive a long tail of unique categories"""
+        rng = random.Random(7)
+        stream = ["Groceries"] * 3000 + ["Fuel"] * 2000 + [f"Merchant {i}" for i in range(20000)]
+        rng.shuffle(stream)
+        counter = SpaceSavingCounter(capacity=50)
+        counter.update(stream)
+        truth = Counter(stream)
+        
+        self.assertLessEqual(len(counter), 50)
+        self.assertEqual([i for i, _, _ in counter.top(2)], ["Groceries", "Fuel"])
+        for item, count, error in counter.top(50):
+            self.assertLessEqual(error, counter.max_error())
+            self.assertGreaterEqual(count, truth[item])
+            self.assertLessEqual(count - error, truth[item])
+    
+    def test_empty_and_invalid(self):
+        """Test empty counters and bad capacities"""
+        self.assertIsNone(SpaceSavingCounter(3).most_frequent())
+        self.assertEqual(SpaceSavingCounter(3).top(), [])
+        with self.assertRaises(ValueError):
+            SpaceSavingCounter(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
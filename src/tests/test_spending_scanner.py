@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import io
+import tempfile
+import shutil
+from contextlib import redirect_stdout
+from unittest import mock
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'classes'))
+import spending_scanner
+from spending_scanner import scan_spending_file
+from Transaction import Transaction
+
+
+class TestSpendingScanner(unittest.TestCase):
+    """Tests for the chunked spending file scanner"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, "monthly_spending.txt")
+        categories = ["Food", "Transport", "Housing", "Fun"]
+        with open(self.filename, "w") as f:
+            for i in range(500):
+                f.write(f"{['January', 'February', 'March'][i % 3]},{i % 50 + 0.25},{categories[i % 4]},Item {i}, extra\n")
+            f.write("April,3.0,Transport\n")  # counted as a category, not a record
+            f.write("\n")
+            f.write("April,7.5,Housing,Rent")  # no trailing newline
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def expected_totals(self):
+        totals = {}
+        with redirect_stdout(io.StringIO()):
+            for t in Transaction.get_all_transactions(self.filename):
+                totals[t.month] = totals.get(t.month, 0) + t.amount
+        return totals
+    
+    def assert_matches_transaction(self, scan):
+        expected = self.expected_totals()
+        self.assertEqual(list(scan.monthly_totals), list(expected))
+        for month, amount in expected.items():
+            self.assertAlmostEqual(scan.monthly_totals[month], amount, places=6)
+        self.assertEqual(scan.record_count, 501)
+        self.assertEqual(scan.category_counts["Transport"], 126)
+        self.assertEqual(scan.most_frequent_category(),
+                         Transaction.get_most_frequent_category(self.filename))
+    
+    def test_inline_scan_matches_transaction(self):
+        """Test a single-chunk scan against the Transaction methods"""
+        self.assert_matches_transaction(scan_spending_file(self.filename))
+    
+    def test_parallel_chunks_match_transaction(self):
+        """Test that small newline-aligned chunks across processes give the same answers"""
+        with mock.patch.object(spending_scanner, "INLINE_SCAN_BYTES", 0):
+            scan = scan_spending_file(self.filename, workers=2, chunk_size=997)
+        self.assert_matches_transaction(scan)
+    
+    def test_ties_go_to_first_category_seen(self):
+        """Test that merging chunks in order keeps the sequential tie-break"""
+        with open(self.filename, "w") as f:
+            f.write("May,1,Zoo,a\n" * 3 + "May,1,Alpha,b\n" * 3)
+        with mock.patch.object(spending_scanner, "INLINE_SCAN_BYTES", 0):
+            scan = scan_spending_file(self.filename, workers=2, chunk_size=12)
+        self.assertEqual(scan.most_frequent_category(), "Zoo")
+        self.assertEqual(scan.most_frequent_category(), Transaction.get_most_frequent_category(self.filename))
+    
+    def test_missing_and_empty_files(self):
+        """Test missing and empty files"""
+        self.assertIsNone(scan_spending_file(os.path.join(self.test_dir, "missing.txt")))
+        empty = os.path.join(self.test_dir, "empty.txt")
+        open(empty, "w").close()
+        scan = scan_spending_file(empty)
+        self.assertIsNone(scan.most_frequent_category())
+        self.assertEqual(scan.monthly_totals, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
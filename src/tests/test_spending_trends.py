@@ -0,0 +1,64 @@
+import unittest
+import sys
+from unittest import mock
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'classes'))
+import spending_trends
+from spending_trends import build_spending_matrix, spending_trends as trends_of
+from BudgetAnalyzer import BudgetAnalyzer
+from Expense import Expense
+from ExpenseTracker import ExpenseTracker
+
+
+class TestSpendingTrends(unittest.TestCase):
+    """Tests for the month x category trend engine"""
+    
+    def setUp(self):
+        """Set up three months of spending with a gap month"""
+        self.transactions = [
+            {"date": "2024-01-15", "amount": 400.0, "category": "Food"},
+            {"date": "2024-01-20", "amount": 1500.0, "category": "Housing"},
+            {"date": "2024-02-15", "amount": 500.0, "category": "Food"},
+            {"date": "2024-02-20", "amount": 1500.0, "category": "Housing"},
+            {"date": "2024-02-21", "amount": 100.0, "category": "Food"},
+            {"date": "2024-04-20", "amount": 1600.0, "category": "Housing"},
+        ]
+    
+    def test_matrix_fills_gap_months(self):
+        """Test months run without gaps and cells sum per category"""
+        months, categories, rows = build_spending_matrix(self.transactions)
+        self.assertEqual(months, [(2024, 1), (2024, 2), (2024, 3), (2024, 4)])
+        self.assertEqual(categories, ["Food", "Housing"])
+        self.assertEqual(rows, [[400, 1500], [600, 1500], [0, 0], [0, 1600]])
+    
+    def test_pure_python_matches_numpy_path(self):
+        """Test the fallback builds the same matrix"""
+        expected = build_spending_matrix(self.transactions)
+        with mock.patch.object(spending_trends, "np", None):
+            self.assertEqual(build_spending_matrix(self.transactions), expected)
+    
+    def test_changes_growth_and_rolling_averages(self):
+        """Test derived series for one category"""
+        food = trends_of(self.transactions)["Food"]
+        self.assertEqual(food["months"], ["2024-01", "2024-02", "2024-03", "2024-04"])
+        self.assertEqual(food["change"], [None, 200, -600, 0])
+        self.assertEqual(food["growth"], [None, 0.5, -1.0, None])
+        self.assertEqual(food["rolling_3"], [None, None, 1000 / 3, 200])
+        self.assertEqual(food["rolling_12"], [None] * 4)
+        self.assertEqual(food["total"], 1000)
+    
+    def test_analyzer_uses_engine(self):
+        """Test BudgetAnalyzer entry points, with Expense objects and no constructor arguments"""
+        self.assertIn("Food", BudgetAnalyzer().analyze_spending_trends(self.transactions))
+        tracker = ExpenseTracker()
+        for t in self.transactions:
+            tracker.add_expense(Expense(t["amount"], t["category"], "item", t["date"]))
+        analyzer = BudgetAnalyzer(tracker=tracker)
+        trends = analyzer.detect_spending_trends()
+        self.assertEqual(trends["Housing"]["latest_change"], 1600)
+        self.assertIs(analyzer.detect_spending_trends(), trends)
+        self.assertEqual(trends_of([]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import sys
+import os
+import io
+import tempfile
+import shutil
+from contextlib import redirect_stdout
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'classes'))
+import Transaction as transaction_module
+from Transaction import Transaction, TransactionWriter
+
+
+class TestTransactionFileCache(unittest.TestCase):
+    """Tests for the shared parsed-file cache behind Transaction reads"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, "monthly_spending.txt")
+        with open(self.filename, "w") as f:
+            f.write("January,150.0,Food,Groceries\n")
+            f.write("January,40.0,Transport,Gas, premium\n")
+            f.write("February,12.5,Food,Lunch\n")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def append(self, text):
+        with open(self.filename, "a") as f:
+            f.write(text)
+    
+    def test_reads_all_transactions(self):
+        """Test parsed transactions and the most frequent category"""
+        transactions = Transaction.get_all_transactions(self.filename)
+        self.assertEqual([t.amount for t in transactions], [150.0, 40.0, 12.5])
+        self.assertEqual(transactions[1].description, "Gas, premium")
+        self.assertEqual(Transaction.get_most_frequent_category(self.filename), "Food")
+    
+    def test_appends_are_parsed_incrementally(self):
+        """Test that only appended bytes are parsed after a cache hit"""
+        Transaction.get_all_transactions(self.filename)
+        entry = transaction_module._PARSED_FILES[os.path.abspath(self.filename)]
+        offset = entry.offset
+        
+        self.append("March,20.0,Transport,Bus\nMarch,25.0,Transport,Taxi\n")
+        self.assertEqual(len(Transaction.get_all_transactions(self.filename)), 5)
+        self.assertIs(transaction_module._PARSED_FILES[os.path.abspath(self.filename)], entry)
+        self.assertGreater(entry.offset, offset)
+        self.assertEqual(Transaction.get_most_frequent_category(self.filename), "Transport")
+    
+    def test_partial_last_line(self):
+        """Test a last line without newline is read, and re-read once completed"""
+        self.append("March,20.0,Rent")
+        self.assertEqual(len(Transaction.get_all_transactions(self.filename)), 3)
+        self.append(",Apartment\n")
+        transactions = Transaction.get_all_transactions(self.filename)
+        self.assertEqual(transactions[-1].description, "Apartment")
+        self.assertEqual(len(transactions), 4)
+    
+    def test_rewritten_file_is_reparsed(self):
+        """Test that a shrunk file is parsed from scratch"""
+        Transaction.get_all_transactions(self.filename)
+        with open(self.filename, "w") as f:
+            f.write("May,9.0,Gifts,Card\n")
+        self.assertEqual(Transaction.get_most_frequent_category(self.filename), "Gifts")
+    
+    def test_larger_rewrite_is_reparsed(self):
+        """Test that a file rewritten to a larger size is not read as an append"""
+        self.assertEqual(Transaction.get_most_frequent_category(self.filename), "Food")
+        with open(self.filename, "w") as f:
+            for i in range(5):
+                f.write(f"June,{i}.0,Travel,Trip leg {i}\n")
+        transactions = Transaction.get_all_transactions(self.filename)
+        self.assertEqual([t.category for t in transactions], ["Travel"] * 5)
+        self.assertEqual(Transaction.get_most_frequent_category(self.filename), "Travel")
+    
+    def test_missing_file(self):
+        """Test missing files behave as before"""
+        missing = os.path.join(self.test_dir, "missing.txt")
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(Transaction.get_all_transactions(missing), [])
+        self.assertIsNone(Transaction.get_most_frequent_category(missing))
+        self.assertIsNone(Transaction.get_most_frequent_category(missing, max_categories=10))
+    
+    def test_bounded_category_count(self):
+        """Test the streaming bounded count agrees with the cached count"""
+        self.assertEqual(Transaction.get_most_frequent_category(self.filename, max_categories=1), "Food")
+        self.append("".join(f"March,1.0,{'Food' if i % 4 == 0 else f'Store {i}'},x\n" for i in range(200)))
+        self.assertEqual(Transaction.get_most_frequent_category(self.filename, max_categories=8),
+                         Transaction.get_most_frequent_category(self.filename))
+
+
+class TestTransactionWriter(unittest.TestCase):
+    """Tests for buffered batch writes"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, "monthly_spending.txt")
+        self.transactions = [Transaction(10.0 + i, "Food", f"Meal {i}, takeout", "January") for i in range(25)]
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_save_many_round_trips(self):
+        """Test that batch-written lines read back like single saves"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            count = Transaction.save_many(self.transactions, self.filename)
+        self.assertEqual(count, 25)
+        self.assertEqual(output.getvalue(), "")
+        
+        loaded = Transaction.get_all_transactions(self.filename)
+        self.assertEqual([t.amount for t in loaded], [t.amount for t in self.transactions])
+        self.assertEqual(loaded[3].description, "Meal 3, takeout")
+        
+        single = os.path.join(self.test_dir, "single.txt")
+        with redirect_stdout(io.StringIO()):
+            for t in self.transactions:
+                t.save(single)
+        with open(single) as a, open(self.filename) as b:
+            self.assertEqual(a.read(), b.read())
+    
+    def test_flushes_on_size_threshold(self):
+        """Test that full buffers reach the file before the writer closes"""
+        with TransactionWriter(self.filename, max_lines=10, flush_interval=60) as writer:
+            for t in self.transactions:
+                writer.write(t)
+            self.assertEqual(writer.written, 20)
+            with open(self.filename) as f:
+                self.assertEqual(len(f.readlines()), 20)
+        self.assertEqual(writer.written, 25)
+    
+    def test_loud_mode_prints_summary(self):
+        """Test that quiet=False prints one summary line"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            Transaction.save_many(self.transactions, self.filename, quiet=False)
+        self.assertEqual(output.getvalue(), "25 transactions saved successfully.\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
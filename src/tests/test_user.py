@@ -0,0 +1,182 @@
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'classes'))
+from User import User, UserRegistry, fcntl
+
+
+class TestUserRegistry(unittest.TestCase):
+    """Tests for the in-memory index behind User uniqueness checks"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = os.path.join(self.test_dir, "users.txt")
+        with open(self.storage, "w", encoding="utf-8") as f:
+            f.write("Alice,California,123456\n")
+            f.write("bob,,654321\n")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_lookups(self):
+        """Test username (case-insensitive) and user_id membership"""
+        registry = UserRegistry(self.storage)
+        self.assertTrue(registry.has_username(" alice "))
+        self.assertTrue(registry.has_username("BOB"))
+        self.assertFalse(registry.has_username("carol"))
+        self.assertTrue(registry.has_user_id("654321"))
+        self.assertFalse(registry.has_user_id("000000"))
+    
+    def test_sees_appends_from_other_writers(self):
+        """Test that the registry picks up lines appended after it loaded"""
+        registry = UserRegistry(self.storage)
+        self.assertFalse(registry.has_username("carol"))
+        with open(self.storage, "a", encoding="utf-8") as f:
+            f.write("carol,Texas,111111\n")
+        self.assertTrue(registry.has_username("carol"))
+        self.assertTrue(registry.has_user_id("111111"))
+    
+    def test_partial_line_is_dropped_once_completed(self):
+        """Test that a line seen mid-write does not stay indexed under its unfinished name"""
+        registry = UserRegistry(self.storage)
+        with open(self.storage, "a", encoding="utf-8") as f:
+            f.write("carol")
+        self.assertTrue(registry.has_username("carol"))
+        with open(self.storage, "a", encoding="utf-8") as f:
+            f.write("ine,Ohio,222222\n")
+        self.assertTrue(registry.has_username("caroline"))
+        self.assertFalse(registry.has_username("carol"))
+        self.assertEqual(len(registry), 3)
+        User("carol", storage_path=self.storage)
+    
+    def test_reloads_when_file_shrinks(self):
+        """Test that a rewritten, smaller file is fully re-indexed"""
+        registry = UserRegistry(self.storage)
+        self.assertTrue(registry.has_username("alice"))
+        with open(self.storage, "w", encoding="utf-8") as f:
+            f.write("dan,,222222\n")
+        self.assertFalse(registry.has_username("alice"))
+        self.assertTrue(registry.has_username("dan"))
+    
+    def test_reloads_when_file_is_rewritten_larger(self):
+        """Test that a rewritten file that grew is re-indexed, not read as an append"""
+        registry = UserRegistry(self.storage)
+        self.assertTrue(registry.has_username("alice"))
+        with open(self.storage, "w", encoding="utf-8") as f:
+            f.write("bobby,Ohio,333333\ncarol,Texas,444444\nfrank,Utah,555555\n")
+        self.assertFalse(registry.has_username("alice"))
+        self.assertTrue(registry.has_username("bobby"))
+        self.assertFalse(registry.has_user_id("123456"))
+        with self.assertRaises(ValueError):
+            User("Bobby", storage_path=self.storage)
+        
+        # Replaced by rename: new inode, same leading bytes
+        replacement = self.storage + ".new"
+        with open(replacement, "w", encoding="utf-8") as f:
+            f.write("bobby,Ohio,333333\ncarol,Texas,444444\ngrace,Iowa,666666\nheidi,,777777\n")
+        os.replace(replacement, self.storage)
+        self.assertFalse(registry.has_username("frank"))
+        self.assertTrue(registry.has_username("grace"))
+    
+    def test_user_uses_registry(self):
+        """Test that User creation and save go through the shared registry"""
+        with self.assertRaises(ValueError):
+            User("ALICE", storage_path=self.storage)
+        user = User("erin", "Texas", storage_path=self.storage)
+        user.save()
+        self.assertTrue(User.is_username_taken("Erin", self.storage))
+        self.assertTrue(UserRegistry.for_path(self.storage).has_user_id(user.user_id))
+
+
+class TestCreateMany(unittest.TestCase):
+    """Tests for bulk user provisioning"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = os.path.join(self.test_dir, "users.txt")
+        with open(self.storage, "w", encoding="utf-8") as f:
+            f.write("alice,California,123456\n")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def read_lines(self):
+        with open(self.storage, encoding="utf-8") as f:
+            return f.read().splitlines()
+    
+    def test_creates_and_saves_all_users(self):
+        """Test that every user is written once with a unique id"""
+        records = [(f"user{i}", "Texas") for i in range(500)] + [{"username": "zoe"}]
+        users = User.create_many(records, self.storage)
+        
+        self.assertEqual(len(users), 501)
+        lines = self.read_lines()
+        self.assertEqual(len(lines), 502)
+        ids = [line.split(",")[2] for line in lines]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertTrue(all(len(i) == 6 and i.isdigit() for i in ids))
+        self.assertEqual(users[-1].state, None)
+        self.assertTrue(User.is_username_taken("user499", self.storage))
+    
+    def test_invalid_record_writes_nothing(self):
+        """Test all-or-nothing validation for states and duplicates"""
+        with self.assertRaises(ValueError):
+            User.create_many([("bob", "Texas"), ("carl", "Atlantis")], self.storage)
+        with self.assertRaises(ValueError):
+            User.create_many([("bob", "Texas"), ("BOB", "Ohio")], self.storage)
+        with self.assertRaises(ValueError):
+            User.create_many([("Alice", "Texas")], self.storage)
+        self.assertEqual(len(self.read_lines()), 1)
+
+
+def _register_worker(storage, names):
+    """Register each name, ignoring names another process got first"""
+    registered = 0
+    for name in names:
+        try:
+            User.register(name, "Texas", storage_path=storage)
+            registered += 1
+        except ValueError:
+            pass
+    return registered
+
+
+@unittest.skipIf(fcntl is None, "file locking needs fcntl")
+class TestConcurrentRegistration(unittest.TestCase):
+    """Stress test: overlapping registrations from several processes"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.storage = os.path.join(self.test_dir, "users.txt")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+    
+    def test_no_duplicates_across_processes(self):
+        """Test that every username and id is stored exactly once"""
+        names = [f"user{i}" for i in range(60)]
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            counts = list(pool.map(_register_worker, [self.storage] * 4,
+                                   [names, names[::-1], names[20:] + names[:20], names]))
+        
+        with open(self.storage, encoding="utf-8") as f:
+            rows = [line.rstrip("\n").split(",") for line in f]
+        usernames = [r[0] for r in rows]
+        ids = [r[2] for r in rows]
+        self.assertEqual(sum(counts), len(names))
+        self.assertEqual(sorted(usernames), sorted(names))
+        self.assertEqual(len(set(ids)), len(ids))
+
+
+if __name__ == '__main__':
+    unittest.main()